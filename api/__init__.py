@@ -3,6 +3,8 @@ from .events import event_bp
 from .game import game_bp
 from .news import news_bp, tags_bp
 from .season import season_bp
+from .club import club_bp
+from .tournament import tournament_bp
 import logging
 
 log = logging.getLogger(__name__)
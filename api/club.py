@@ -0,0 +1,17 @@
+from flask.views import MethodView
+from flask_smorest import Blueprint
+
+from controllers.stats_controller import CLUB, LeaderboardArgsSchema, PlayerStatsService
+from decorators import format_response
+from schemas import PlayerStatsSchema
+
+club_bp = Blueprint("clubs", __name__, description="Operations on clubs")
+
+
+@club_bp.route("/clubs/<int:club_id>/leaderboard")
+class ClubLeaderboard(MethodView):
+    @club_bp.arguments(LeaderboardArgsSchema, location="query")
+    @club_bp.response(200, PlayerStatsSchema(many=True))
+    @format_response
+    def get(self, args, club_id):
+        return PlayerStatsService().leaderboard_page(CLUB, club_id, args)
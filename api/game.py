@@ -1,16 +1,16 @@
-from flask import request, jsonify
+from flask import Response, current_app, request
 from flask.views import MethodView
 from flask_smorest import Blueprint, abort
-from marshmallow import ValidationError
 from sqlalchemy.exc import IntegrityError
 import logging
 
 from decorators import format_response
+from pagination import PaginationArgsSchema, paginate
 from extensions import db
 from models import Match
-from schemas import GameSchema
 from schemas.match import MatchSchema
-from controllers.game_controller import MatchService
+from controllers.broadcast import broadcaster, format_sse
+from controllers.game_controller import GameService, MatchService
 from controllers.match_controller import MatchEventService
 
 log = logging.getLogger(__name__)
@@ -29,36 +29,18 @@ class HandleGame(MethodView):
     @format_response
     def post(self):
         json_data = request.json
-        game_schema = GameSchema(session=db.session)
         log.info(f"POST /game")
-        try:
-            log.info(f"Request data: {json_data}")
-            new_game = game_schema.load(json_data)
-            db.session.add(new_game)
-            db.session.commit()
-            log.info(f"Game added: {new_game}")
-            return game_schema.dump(new_game), 201
-        except ValidationError as err:
-            log.error(f"Validation error: {err}")
-            abort(400, message=f"Validation Error: {err}")
-        except IntegrityError as e:
-            db.session.rollback()
-            log.error(f"IntegrityError: {e.orig}")
-            abort(400, message=f"IntegrityError: {str(e.orig)}")
-        except Exception as e:
-            log.error(f"Unexpected error: {e}")
-            abort(500, message="An unexpected error occurred")
+        log.info(f"Request data: {json_data}")
+        return GameService().create_game(json_data), 201
 
 
 @game_bp.route("/game/all")
 class HandleAllGame(MethodView):
+    @game_bp.arguments(PaginationArgsSchema, location="query")
     @format_response
-    def get(self):
+    def get(self, args):
         log.info("GET /game/all")
-        matches_schema = MatchSchema(session=db.session, many=True)
-        all_matches = Match.query.all()
-        log.debug(f"All matches: {matches_schema.dump(all_matches)}")
-        return matches_schema.dump(all_matches), 200
+        return paginate(Match.query, Match, MatchSchema, args, session=db.session)
 
 
 @game_bp.route("/game/<int:game_id>/match")
@@ -69,10 +51,10 @@ class HandleAllMatch(MethodView, Services):
             match_id = self.controller_match.start_match(
                 self.controller_match(), game_id
             )
-            return jsonify({"match_id": str(match_id)}), 201
+            return {"match_id": str(match_id)}, 201
         except ValueError as e:
             log.error(f"ValueError: {e}")
-            return jsonify({"error": str(e)}), 400
+            return {"error": str(e)}, 400
 
     @format_response
     def get(self, game_id):
@@ -85,9 +67,7 @@ class HandleAllMatch(MethodView, Services):
             )
         if not all_matches:
             return (
-                jsonify(
-                    {"count": 0, "message": f"No current matches in game {game_id}"}
-                ),
+                {"count": 0, "message": f"No current matches in game {game_id}"},
                 404,
             )
         return self.matches_schema.dump(all_matches), 200
@@ -102,7 +82,7 @@ class HandleMatch(MethodView, Services):
                 self.controller_match(), match_id=match_id, game_id=game_id
             )
             log.info(f"Match status: {status}")
-            return jsonify(status), 200
+            return status, 200
         except Exception as e:
             log.error(f"Error retrieving match status: {e}")
             abort(500, message="An unexpected error occurred")
@@ -121,7 +101,7 @@ class HandleMatchEventsView(MethodView, Services):
             )
             log.info(f"Match status: {status}")
             log.info(f"Log match: {events}")
-            return jsonify({"gamestate": status, "gamelog": events}), 200
+            return {"gamestate": status, "gamelog": events}, 200
         except Exception as e:
             log.error(f"Error retrieving match status: {e}")
             abort(500, message="An unexpected error occurred")
@@ -149,10 +129,80 @@ class HandleMatchEventsProcess(MethodView, Services):
                 event_type=json_data.get("event_type"),
                 write=json_data.get("write"),
             )
-            return jsonify({"event": event}), 200
+            return {"event": event}, 200
         except IntegrityError as e:
             log.error(f"Error in db: {e.orig}")
             abort(500, message="An unexpected error occurred")
         except KeyError as e:
             log.error(f"Error retrieving match status: {e}")
             abort(500, message="An unexpected error occurred")
+
+
+@game_bp.route("/game/<int:game_id>/match/<int:match_id>/events:batch")
+class HandleMatchEventsBatch(MethodView, Services):
+    @format_response
+    def post(self, game_id, match_id):
+        log.info(f"Received batch for game_id: {game_id}, match_id: {match_id}")
+        json_data = request.get_json()
+
+        # Either a bare array of events or {"events": [...]}
+        events = json_data.get("events") if isinstance(json_data, dict) else json_data
+        if not isinstance(events, list) or not all(
+            isinstance(event, dict) for event in events
+        ):
+            log.error("No list of events provided in the request")
+            abort(400, message="Expected an array of events")
+
+        game_type = "8ball"
+        try:
+            match_state, results = self.controller_matchevents.process_events(
+                self.controller_matchevents(),
+                match_id=match_id,
+                game_type=game_type,
+                events=events,
+            )
+            return {"event": match_state, "results": results}, 200
+        except IntegrityError as e:
+            log.error(f"Error in db: {e.orig}")
+            abort(500, message="An unexpected error occurred")
+
+
+@game_bp.route("/game/<int:game_id>/match/<int:match_id>/stream")
+class HandleMatchStream(MethodView, Services):
+    def get(self, game_id, match_id):
+        """
+        Server-Sent Events stream of a match: the current state once, then
+        the new events and changed state keys as they are committed.
+        """
+        log.info(f"GET /game/{game_id}/match/{match_id}/stream")
+        # Subscribe before reading the state so no commit falls in between
+        subscription = broadcaster.subscribe(match_id)
+        try:
+            match_state, last_event_id = self.controller_matchevents.get_match_state(
+                self.controller_matchevents(), game_type="8ball", match_id=match_id
+            )
+        except Exception:
+            broadcaster.unsubscribe(subscription)
+            raise
+        initial = format_sse(
+            "state",
+            current_app.json.dumps(
+                {"state": match_state, "last_event_id": last_event_id}
+            ),
+        )
+        heartbeat = current_app.config["SSE_HEARTBEAT_INTERVAL"]
+
+        def stream():
+            try:
+                yield initial
+                while not subscription.closed:
+                    message = subscription.get(timeout=heartbeat)
+                    yield message if message is not None else ": keep-alive\n\n"
+            finally:
+                broadcaster.unsubscribe(subscription)
+
+        return Response(
+            stream(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
@@ -7,9 +7,11 @@ from marshmallow import ValidationError
 from sqlalchemy.exc import IntegrityError
 
 from decorators import format_response
+from pagination import PaginationArgsSchema, paginate
 from extensions import db
 from models.news import News, Tag
 from schemas import TagSchema, NewsSchema
+from schemas.registry import get_schema
 
 log = logging.getLogger()
 news_bp = Blueprint("news", __name__, description="Operation on news")
@@ -18,21 +20,19 @@ tags_bp = Blueprint("tags", __name__, description="Operations on tags")
 
 @tags_bp.route("/tags")
 class Tags(MethodView):
+    @tags_bp.arguments(PaginationArgsSchema, location="query")
     @tags_bp.response(200, TagSchema(many=True))
     @format_response
-    def get(self):
+    def get(self, args):
         """List tags"""
-        tags = Tag.query.all()
-        tag_schema = TagSchema(many=True)
-        data = tag_schema.dump(tags)
-        return data
+        return paginate(Tag.query, Tag, TagSchema, args)
 
     @tags_bp.response(201, TagSchema)
     @format_response
     def post(self):
         """Create a new tag"""
         json_data = request.get_json()
-        tag_schema = TagSchema()
+        tag_schema = get_schema(TagSchema)
         try:
             new_tag = Tag(**json_data)
             db.session.add(new_tag)
@@ -51,21 +51,19 @@ class Tags(MethodView):
 
 @news_bp.route("/news")
 class Newses(MethodView):
+    @news_bp.arguments(PaginationArgsSchema, location="query")
     @news_bp.response(200, NewsSchema(many=True))
     @format_response
-    def get(self):
+    def get(self, args):
         """List news"""
-        newses = News.query.all()
-        news_schema = NewsSchema(many=True)
-        data = news_schema.dump(newses)
-        return data
+        return paginate(News.query, News, NewsSchema, args)
 
     @news_bp.response(201, NewsSchema)
     @format_response
     def post(self):
         """Create a new news item"""
         json_data = request.get_json()
-        news_schema = NewsSchema()
+        news_schema = get_schema(NewsSchema)
         try:
             news_data = news_schema.load(json_data)
             news_item = News(
@@ -1,6 +1,6 @@
 import logging
 
-from flask import request, jsonify
+from flask import request
 from flask.views import MethodView
 from flask_smorest import Blueprint, abort
 from marshmallow import ValidationError
@@ -11,6 +11,7 @@ from extensions import db
 from decorators import format_response
 from models.user import User
 from schemas import PlayerSchema
+from schemas.registry import get_schema
 from schemas.user import UserSchema
 
 player_bp = Blueprint("api", __name__)
@@ -25,7 +26,7 @@ class Register(MethodView):
         if existing_user:
             abort(400, message="Player already exists")
         try:
-            user_schema = UserSchema(session=db.session)
+            user_schema = get_schema(UserSchema, session=db.session)
             data = UserSchema.load(user_schema, data=json_data)
             logging.info(f"New player validated: {data}")
         except ValidationError as e:
@@ -44,13 +45,11 @@ class Register(MethodView):
             db.session.add(player)
             db.session.commit()
             return (
-                jsonify(
-                    {
-                        "message": "Registration successful",
-                        "id": user.id,
-                        "new_player": "Created",
-                    }
-                ),
+                {
+                    "message": "Registration successful",
+                    "id": user.id,
+                    "new_player": "Created",
+                },
                 201,
             )
-        return jsonify({"message": "Registration successful", "id": user.id}), 201
+        return {"message": "Registration successful", "id": user.id}, 201
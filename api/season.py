@@ -6,9 +6,16 @@ from marshmallow import ValidationError
 from sqlalchemy.exc import IntegrityError
 
 from decorators import format_response
+from controllers.stats_controller import (
+    SEASON,
+    LeaderboardArgsSchema,
+    PlayerStatsService,
+)
+from pagination import PaginationArgsSchema, paginate
 from extensions import db
 from models.season import Season
-from schemas import SeasonSchema
+from schemas import PlayerStatsSchema, SeasonSchema
+from schemas.registry import get_schema
 from decorators import format_response
 
 season_bp = Blueprint("seasons", __name__, description="Operations on seasons")
@@ -16,19 +23,17 @@ season_bp = Blueprint("seasons", __name__, description="Operations on seasons")
 
 @season_bp.route("/seasons")
 class Seasons(MethodView):
+    @season_bp.arguments(PaginationArgsSchema, location="query")
     @season_bp.response(200, SeasonSchema(many=True))
     @format_response
-    def get(self):
-        seasons = Season.query.all()
-        season_schema = SeasonSchema(many=True)
-        data = season_schema.dump(seasons)
-        return data
+    def get(self, args):
+        return paginate(Season.query, Season, SeasonSchema, args)
 
     @season_bp.arguments(SeasonSchema)
     @season_bp.response(201, SeasonSchema)
     @format_response
     def post(self, new_season):
-        season_schema = SeasonSchema()
+        season_schema = get_schema(SeasonSchema)
         try:
             season = season_schema.load(new_season, session=db.session)
             db.session.add(season)
@@ -41,3 +46,12 @@ class Seasons(MethodView):
 
         logging.log(20, season_schema.dump(season))
         return season_schema.dump(season), 201
+
+
+@season_bp.route("/seasons/<int:season_id>/leaderboard")
+class SeasonLeaderboard(MethodView):
+    @season_bp.arguments(LeaderboardArgsSchema, location="query")
+    @season_bp.response(200, PlayerStatsSchema(many=True))
+    @format_response
+    def get(self, args, season_id):
+        return PlayerStatsService().leaderboard_page(SEASON, season_id, args)
@@ -0,0 +1,60 @@
+from flask.views import MethodView
+from flask_smorest import Blueprint
+
+from controllers.standings_controller import StandingsService
+from controllers.tournament_controller import TournamentService
+from decorators import format_response
+from extensions import db
+from models import Game
+from pagination import PaginationArgsSchema, paginate
+from schemas import GameResultSchema, GameSchema, TournamentStandingSchema
+from schemas.registry import get_schema
+
+tournament_bp = Blueprint(
+    "tournaments", __name__, description="Operations on tournaments"
+)
+
+
+@tournament_bp.route("/tournaments/<int:tournament_id>/schedule")
+class TournamentSchedule(MethodView):
+    @tournament_bp.arguments(PaginationArgsSchema, location="query")
+    @tournament_bp.response(200, GameSchema(many=True))
+    @format_response
+    def get(self, args, tournament_id):
+        """List the tournament games round by round"""
+        query = Game.query.filter(Game.tournament_id == tournament_id)
+        return paginate(query, Game, GameSchema, args, session=db.session)
+
+    @format_response
+    def post(self, tournament_id):
+        """Generate the rounds of a tournament; Swiss gets its first round only"""
+        return TournamentService().generate_schedule(tournament_id), 201
+
+
+@tournament_bp.route("/tournaments/<int:tournament_id>/standings")
+class TournamentStandings(MethodView):
+    @tournament_bp.response(200, TournamentStandingSchema(many=True))
+    @format_response
+    def get(self, tournament_id):
+        """Ranked standings with Buchholz, Sonneborn-Berger and head-to-head"""
+        standings = StandingsService().standings(tournament_id)
+        return get_schema(TournamentStandingSchema, many=True).dump(standings)
+
+
+@tournament_bp.route("/tournaments/<int:tournament_id>/rounds")
+class TournamentRounds(MethodView):
+    @format_response
+    def post(self, tournament_id):
+        """Pair the next round of a Swiss tournament"""
+        return TournamentService().pair_next_round(tournament_id), 201
+
+
+@tournament_bp.route("/tournaments/<int:tournament_id>/games/<int:game_id>/result")
+class TournamentGameResult(MethodView):
+    @tournament_bp.arguments(GameResultSchema)
+    @format_response
+    def post(self, result, tournament_id, game_id):
+        """Record the winner of a tournament game"""
+        return TournamentService().record_result(
+            tournament_id, game_id, result["winner_id"]
+        )
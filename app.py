@@ -1,51 +1,80 @@
+import argparse
 import logging
 from flask import Flask
 from flask_cors import CORS
-from flask_migrate import upgrade
 from flask_smorest import Api
 from opentelemetry.instrumentation.flask import FlaskInstrumentor
 from sqlalchemy.orm import scoped_session, sessionmaker
 
-from api import player_bp, news_bp, game_bp, event_bp, season_bp, tags_bp
-from extensions import db, migrate
+from api import (
+    player_bp,
+    news_bp,
+    game_bp,
+    event_bp,
+    season_bp,
+    tags_bp,
+    club_bp,
+    tournament_bp,
+)
+from cli import register_commands
+from extensions import db, migrate, apply_sqlite_pragmas
+from json_provider import init_json_provider
 from config import ProductionConfig, Config, TestConfig
 from scheduler import start_scheduler
+from startup import StartupProfile, profile_startup
 from utils import log
-from metrics import meter
+import metrics
+import query_profiler
 
 
 
-def create_app(config_class=ProductionConfig):
+def create_app(config_class=ProductionConfig, profile=None):
     """
     Function to create the Flask application
 
     :param config_class: Configuration class to use
+    :param profile: optional StartupProfile that records the time of each step
     :return: Flask application instance
     """
+    profile = profile or StartupProfile()
     app = Flask(__name__)
     log.info(f"{app.name} is starting...")
     app.config.from_object(config_class)
+    app.config.from_prefixed_env()
     log.info(f"Config '{config_class.__name__}' configured...")
+    profile.mark("config")
+    init_json_provider(app)
+    log.info(f"JSON provider '{type(app.json).__name__}' registered...")
+    profile.mark("json provider")
     FlaskInstrumentor().instrument_app(app, enable_commenter=True, commenter_options={})
+    # Exporters are set up on the first request, i.e. after a pre-fork server forked
+    metrics.init_app(app)
+    profile.mark("telemetry")
 
     # Configure logging based on the configuration class
     config_class.configure_logging()
     log.info("Logging is configured...")
+    profile.mark("logging")
 
     # Initialize database and migrations
     db.init_app(app)
     migrate.init_app(app, db)
+    with app.app_context():
+        for engine in db.engines.values():
+            apply_sqlite_pragmas(engine, app.config)
+            metrics.count_statements(engine)
+    query_profiler.init_app(app)
     log.info("DB and Migrations initialized...")
+    profile.mark("database")
 
-    # Enable CORS
-    CORS(app)
+    # Enable CORS; browsers only let scripts read exposed response headers
+    CORS(app, expose_headers=["X-Next-Cursor"])
     log.info("CORS configured...")
 
     # Initialize API
     api = Api(app)
     log.info("API framework initialized...")
-
-    # Add metrics to application
+    profile.mark("api")
 
     # Register blueprints
     api.register_blueprint(player_bp, url_prefix="/api", name="player_api")
@@ -54,27 +83,46 @@ def create_app(config_class=ProductionConfig):
     api.register_blueprint(event_bp, url_prefix="/api", name="event_api")
     api.register_blueprint(season_bp, url_prefix="/api/", name="season_api")
     api.register_blueprint(tags_bp, url_prefix="/api/", name="tags_api")
+    api.register_blueprint(club_bp, url_prefix="/api", name="club_api")
+    api.register_blueprint(tournament_bp, url_prefix="/api", name="tournament_api")
     log.info("Routes registred...")
+    profile.mark("blueprints")
+
+    register_commands(app)
+    log.info("CLI commands registered...")
+    profile.mark("cli")
 
     with app.app_context():
         # Start the scheduler
         start_scheduler(app)
-        log.info(f"Scheduler for {app.name} should be running.")
+        profile.mark("scheduler")
+
+        # Apply migrations, unless they run as a separate `flask db upgrade` step
+        if app.config["RUN_MIGRATIONS"]:
+            from flask_migrate import upgrade
 
-        # Apply migrations
-        if config_class.TESTING:
-            upgrade(directory="migrations")
-        else:
             upgrade(directory="migrations")
-        log.info("Database migrations applied.")
+            log.info("Database migrations applied.")
+        profile.mark("migrations")
 
         # Log available endpoints
-        for rule in app.url_map.iter_rules():
-            log.info(f"Endpoint: {rule.endpoint}, URL: {rule.rule}")
+        if log.isEnabledFor(logging.DEBUG):
+            for rule in app.url_map.iter_rules():
+                log.debug(f"Endpoint: {rule.endpoint}, URL: {rule.rule}")
 
+    log.info(f"{app.name} is ready in {profile.total * 1000:.1f} ms.")
     return app
 
 
 if __name__ == "__main__":
-    app = create_app(ProductionConfig)
-    app.run(port=5030)
+    parser = argparse.ArgumentParser(description="Run the development server.")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print import and init time per component instead of serving",
+    )
+    if parser.parse_args().profile_startup:
+        print(profile_startup(create_app, ProductionConfig))
+    else:
+        app = create_app(ProductionConfig)
+        app.run(port=5030)
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Benchmarks are run from the repository root as ``python -m benchmarks.<name>``
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Importing the API package first registers every model in the order the
+# marshmallow-sqlalchemy schemas expect, exactly as app.py does.
+import api  # noqa: E402,F401
@@ -0,0 +1,354 @@
+"""
+Benchmark: latency and throughput of the core HTTP endpoints.
+
+Seeds a synthetic league (players, games, matches and their events) into a
+temporary SQLite database migrated like production, then drives the
+endpoints in process through the WSGI test client, one request at a time:
+
+- ``POST /api/game`` and ``POST /api/game/<id>/match``,
+- ``POST .../event`` on matches that already have 10 to 10^4 events, both
+  the first request (no snapshot yet, every event is replayed) and the
+  following ones (snapshot present),
+- ``GET .../events`` match logs of the same lengths,
+- ``GET /api/event`` and ``POST /api/event``.
+
+Results (throughput, mean, p50/p95/p99 and max in ms) are printed and
+written as JSON; ``--compare`` prints the change against an earlier run.
+Run from the repository root::
+
+    python -m benchmarks.load_test [--output results.json] [--compare old.json]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import func, insert
+
+from app import create_app
+from config import ProductionConfig
+from extensions import db
+from models import Event, Game, Match, Player
+from models.user import User
+from models.events import BallPottedEventData, EventType, GlobalEvent
+
+MATCH_LENGTHS = (10, 100, 1_000, 10_000)
+# Rows per executemany call while seeding
+SEED_BATCH = 10_000
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of already sorted samples."""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(samples, elapsed, errors):
+    ordered = sorted(samples)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else None,
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p95_ms": round(percentile(ordered, 0.95), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def measure(requests, expected_status):
+    """
+    Time each ``request()`` call.
+
+    :param requests: callables returning a test client response
+    :return: summary, see :func:`summarize`
+    """
+    samples, errors = [], 0
+    started = time.perf_counter()
+    for request in requests:
+        before = time.perf_counter()
+        response = request()
+        samples.append((time.perf_counter() - before) * 1000)
+        if response.status_code != expected_status:
+            errors += 1
+    return summarize(samples, time.perf_counter() - started, errors)
+
+
+class League:
+    """Bulk-inserted players, games and matches with ball potted events."""
+
+    def __init__(self, players, matches_per_length, filler_events):
+        self.players = players
+        self.matches_per_length = matches_per_length
+        self.filler_events = filler_events
+        self.matches = {}  # events per match -> [(game_id, match_id), ...]
+        self.events = 0
+
+    def seed(self):
+        # start_game global events check that both players are users
+        db.session.execute(
+            insert(User),
+            [
+                {"name": f"User {i}", "email": f"user{i}@example.com", "password": "-"}
+                for i in range(self.players)
+            ],
+        )
+        db.session.execute(
+            insert(Player),
+            [
+                {"name": f"Player {i}", "score": 1500, "user_id": i + 1}
+                for i in range(self.players)
+            ],
+        )
+        # Filler matches of 1000 events give the tables a realistic size
+        lengths = [
+            length for length in MATCH_LENGTHS for _ in range(self.matches_per_length)
+        ] + [1_000] * (self.filler_events // 1_000)
+        pairs = self._create_matches(len(lengths))
+        for length, (game_id, match_id) in zip(lengths, pairs):
+            self.matches.setdefault(length, []).append((game_id, match_id))
+        self._insert_events(
+            (match_id, length) for length, (_, match_id) in zip(lengths, pairs)
+        )
+        db.session.execute(
+            insert(GlobalEvent),
+            [{"description": f"Global event {i}"} for i in range(10_000)],
+        )
+        db.session.commit()
+
+    def new_games(self, count):
+        """Games without a match yet."""
+        return [game_id for game_id, _ in self._create_matches(count, matches=False)]
+
+    def _create_matches(self, count, matches=True):
+        first_game = (db.session.query(func.max(Game.id)).scalar() or 0) + 1
+        games = [
+            {
+                "id": first_game + i,
+                "player1_id": 1 + (2 * i) % self.players,
+                "player2_id": 1 + (2 * i + 1) % self.players,
+            }
+            for i in range(count)
+        ]
+        db.session.execute(insert(Game), games)
+        if not matches:
+            db.session.commit()
+            return [(game["id"], None) for game in games]
+
+        first_match = (db.session.query(func.max(Match.id)).scalar() or 0) + 1
+        db.session.execute(
+            insert(Match),
+            [
+                {"id": first_match + i, "game_id": game["id"], **self._players(game)}
+                for i, game in enumerate(games)
+            ],
+        )
+        return [(game["id"], first_match + i) for i, game in enumerate(games)]
+
+    @staticmethod
+    def _players(game):
+        return {"player1_id": game["player1_id"], "player2_id": game["player2_id"]}
+
+    def _insert_events(self, lengths):
+        event_id = (db.session.query(func.max(Event.id)).scalar() or 0) + 1
+        events, details = [], []
+        for match_id, length in lengths:
+            for i in range(length):
+                events.append(
+                    {
+                        "id": event_id,
+                        "match_id": match_id,
+                        "event_type": EventType.BALL_POTTED,
+                        "description": f"Ball {i % 7 + 1} potted",
+                    }
+                )
+                details.append(
+                    {
+                        "event_id": event_id,
+                        "ball_number": i % 7 + 1,
+                        "pocket_id": i % 6 + 1,
+                    }
+                )
+                event_id += 1
+                if len(events) == SEED_BATCH:
+                    self._flush_events(events, details)
+        self._flush_events(events, details)
+
+    def _flush_events(self, events, details):
+        if events:
+            db.session.execute(insert(Event), events)
+            db.session.execute(insert(BallPottedEventData), details)
+            self.events += len(events)
+            events.clear()
+            details.clear()
+
+
+def run(league, client, requests):
+    """Run every scenario; ``requests`` is the sample size of the cheap ones."""
+    results = {}
+    pot = {
+        "event_type": "BALL_POTTED",
+        "data": {"ball_number": 3, "pocket_id": 2},
+        "write": True,
+    }
+
+    results["POST /api/game"] = measure(
+        (
+            lambda i=i: client.post(
+                "/api/game",
+                json={"player1_id": 1 + i % league.players, "player2_id": 2},
+            )
+            for i in range(requests)
+        ),
+        201,
+    )
+    results["POST /api/game/<id>/match"] = measure(
+        (
+            lambda game_id=game_id: client.post(f"/api/game/{game_id}/match")
+            for game_id in league.new_games(requests)
+        ),
+        201,
+    )
+
+    for length in MATCH_LENGTHS:
+        matches = league.matches[length]
+        results[f"GET events log, {length} events"] = measure(
+            (
+                lambda game_id=game_id, match_id=match_id: client.get(
+                    f"/api/game/{game_id}/match/{match_id}/events"
+                )
+                for game_id, match_id in matches
+            ),
+            200,
+        )
+        event_url = "/api/game/{}/match/{}/event"
+        results[f"POST event, {length} events, no snapshot"] = measure(
+            (
+                lambda url=event_url.format(*match): client.post(url, json=pot)
+                for match in matches
+            ),
+            200,
+        )
+        results[f"POST event, {length} events, snapshot"] = measure(
+            (
+                lambda url=event_url.format(*matches[i % len(matches)]): client.post(
+                    url, json=pot
+                )
+                for i in range(requests)
+            ),
+            200,
+        )
+
+    results["GET /api/event"] = measure(
+        (lambda: client.get("/api/event") for _ in range(requests)), 200
+    )
+    results["POST /api/event start_game"] = measure(
+        (
+            lambda: client.post(
+                "/api/event",
+                json={"event_type": "start_game", "player1_id": 1, "player2_id": 2},
+            )
+            for _ in range(requests)
+        ),
+        201,
+    )
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+    print(f"\nChange of p95 against {baseline_path}:")
+    for name, summary in results.items():
+        old = baseline.get(name)
+        if old is None:
+            print(f"{name:<48} new")
+            continue
+        change = (summary["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100
+        print(
+            f"{name:<48} {old['p95_ms']:9.2f} -> {summary['p95_ms']:9.2f} ms {change:+7.1f}%"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--players", type=int, default=1_000)
+    parser.add_argument(
+        "--matches-per-length",
+        type=int,
+        default=10,
+        help="matches seeded for each of the match lengths",
+    )
+    parser.add_argument(
+        "--filler-events",
+        type=int,
+        default=0,
+        help="extra events in 1000-event matches, to test a bigger database",
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", metavar="BASELINE_JSON")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        class BenchmarkConfig(ProductionConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{directory}/league.db"
+            SCHEDULER_ENABLED = False
+            TELEMETRY_EXPORTER = "none"
+            LOG_LEVEL = "WARNING"
+
+        app = create_app(BenchmarkConfig)
+        with app.app_context():
+            league = League(args.players, args.matches_per_length, args.filler_events)
+            started = time.perf_counter()
+            league.seed()
+            seed_seconds = time.perf_counter() - started
+            print(f"Seeded {league.events} events in {seed_seconds:.1f} s")
+            db.session.remove()
+
+            results = run(league, app.test_client(), args.requests)
+            db.session.remove()
+
+    for name, summary in results.items():
+        print(
+            f"{name:<48} {summary['throughput_rps'] or 0:8.1f} req/s "
+            f"p50 {summary['p50_ms']:8.2f}  p95 {summary['p95_ms']:8.2f}  "
+            f"p99 {summary['p99_ms']:8.2f} ms  errors {summary['errors']}"
+        )
+    report = {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "parameters": vars(args),
+        "seeded_events": league.events,
+        "seed_seconds": round(seed_seconds, 2),
+        "results": results,
+    }
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
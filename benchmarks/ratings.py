@@ -0,0 +1,37 @@
+"""
+Benchmark: Elo replay of a synthetic league, as run by ``flask ratings rebuild``.
+
+Run from the repository root::
+
+    python -m benchmarks.ratings [matches] [players]
+"""
+
+import random
+import sys
+import time
+
+from controllers.rating_controller import RatingService
+
+
+def synthetic_matches(count, players, seed=42):
+    rng = random.Random(seed)
+    matches = []
+    for _ in range(count):
+        player1, player2 = rng.sample(range(1, players + 1), 2)
+        matches.append((player1, player2, rng.choice((player1, player2))))
+    return matches
+
+
+def main(count=1_000_000, players=10_000):
+    matches = synthetic_matches(count, players)
+    service = RatingService(k_factor=32, initial=1500)
+
+    start = time.perf_counter()
+    service.compute(matches)
+    total = time.perf_counter() - start
+
+    print(f"replay: {total:8.2f} s for {count} matches of {players} players")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
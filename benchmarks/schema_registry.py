@@ -0,0 +1,61 @@
+"""
+Benchmark: per-request schema construction vs. the schema registry on the
+event ingestion path (choosing and loading a Hit/Potted/Foul payload).
+
+Run from the repository root::
+
+    python -m benchmarks.schema_registry
+"""
+
+import timeit
+
+from flask import Flask
+
+from extensions import db
+from schemas.events import (
+    BallPottedEventSchema,
+    FoulEventSchema,
+    GlobalEventSchema,
+    HitBallEventSchema,
+)
+from schemas.registry import get_schema
+
+EVENTS = [
+    (HitBallEventSchema, {"ball_number": 3}),
+    (BallPottedEventSchema, {"ball_number": 3, "pocket_id": 2}),
+    (FoulEventSchema, {"reason": "scratch"}),
+]
+
+
+def constructed():
+    for schema_cls, data in EVENTS:
+        schema_cls().load(data, session=db.session)
+    GlobalEventSchema(session=db.session)
+
+
+def registry():
+    for schema_cls, data in EVENTS:
+        get_schema(schema_cls).load(data, session=db.session)
+    get_schema(GlobalEventSchema, session=db.session)
+
+
+def main(number=2_000):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+
+    with app.app_context():
+        registry()  # build the cached variants once, as the first request would
+        results = {
+            "constructed": timeit.timeit(constructed, number=number),
+            "registry": timeit.timeit(registry, number=number),
+        }
+
+    for name, total in results.items():
+        print(f"{name:>12}: {total / number * 1e6:8.1f} us/request")
+    print(f"{'saved':>12}: {(results['constructed'] - results['registry']) / number * 1e6:8.1f} us/request")
+    print(f"{'speedup':>12}: {results['constructed'] / results['registry']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark: Swiss pairing of large fields.
+
+Simulates rounds with random results and times ``swiss_pairings`` for
+every round, without the database. Run from the repository root::
+
+    python -m benchmarks.swiss_pairing [rounds]
+"""
+
+import random
+import sys
+import time
+
+from controllers.swiss import SwissStandings, swiss_pairings
+
+FIELDS = (256, 1_000, 4_000)
+
+
+def simulate(players, rounds, rng):
+    ratings = {player: rng.randint(1000, 2000) for player in range(1, players + 1)}
+    games, timings, rematches = [], [], 0
+    for round_number in range(1, rounds + 1):
+        standings = SwissStandings(ratings, games)
+        start = time.perf_counter()
+        pairs, bye = swiss_pairings(
+            standings.ranked(ratings),
+            standings.points,
+            standings.opponents,
+            standings.byes,
+        )
+        timings.append(time.perf_counter() - start)
+        rematches += sum(player2 in standings.opponents[player1] for player1, player2 in pairs)
+        games.extend(
+            (round_number, player1, player2, rng.choice((player1, player2)))
+            for player1, player2 in pairs
+        )
+        if bye is not None:
+            games.append((round_number, bye, None, bye))
+    return timings, rematches
+
+
+def main(rounds=9):
+    rng = random.Random(42)
+    for players in FIELDS:
+        timings, rematches = simulate(players, rounds, rng)
+        print(
+            f"{players:>6} players: {sum(timings) / rounds * 1e3:7.2f} ms/round avg, "
+            f"{max(timings) * 1e3:7.2f} ms max, {rematches} rematches in {rounds} rounds"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,70 @@
+"""
+Benchmark: generating a full tournament schedule for a large event.
+
+Seeds players into a temporary SQLite database and times
+``TournamentService.generate_schedule`` for every bulk-generated type.
+Run from the repository root::
+
+    python -m benchmarks.tournament_schedule [players]
+"""
+
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from flask import Flask
+
+from controllers.tournament_controller import TournamentService
+from extensions import db
+from models import Player, Tournament, TournamentParticipant
+from models.tounament import TournamentType
+
+
+def create_tournament(tournament_type, player_ids):
+    tournament = Tournament(
+        name=f"Benchmark {tournament_type.value}",
+        tournament_type=tournament_type,
+        organizer="benchmark",
+        start_date=datetime.now(timezone.utc),
+        end_date=datetime.now(timezone.utc),
+    )
+    db.session.add(tournament)
+    db.session.flush()
+    db.session.add_all(
+        TournamentParticipant(tournament_id=tournament.id, player_id=player_id)
+        for player_id in player_ids
+    )
+    db.session.commit()
+    return tournament.id
+
+
+def main(players=512):
+    with tempfile.TemporaryDirectory() as directory:
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{directory}/bench.db"
+        db.init_app(app)
+
+        with app.app_context():
+            db.create_all()
+            db.session.add_all(
+                Player(name=f"Player {i}", score=1500 + i % 400, played_games=1)
+                for i in range(players)
+            )
+            db.session.commit()
+            player_ids = [player_id for (player_id,) in db.session.query(Player.id)]
+
+            for tournament_type in (TournamentType.ROUND_ROBIN, TournamentType.ELIMINATION):
+                tournament_id = create_tournament(tournament_type, player_ids)
+                start = time.perf_counter()
+                summary = TournamentService().generate_schedule(tournament_id)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{tournament_type.value:>12}: {elapsed * 1e3:8.1f} ms for "
+                    f"{summary['games']} games in {summary['rounds']} rounds"
+                )
+            db.session.remove()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,33 @@
+import click
+from flask.cli import AppGroup
+
+stats_cli = AppGroup("stats", help="Maintenance of materialized player statistics.")
+
+
+@stats_cli.command("rebuild")
+def rebuild_stats():
+    """Recompute player_stats from the match history."""
+    from controllers.stats_controller import PlayerStatsService
+
+    rows = PlayerStatsService().rebuild()
+    click.echo(f"Rebuilt {rows} player stats rows.")
+
+
+ratings_cli = AppGroup("ratings", help="Player Elo ratings.")
+
+
+@ratings_cli.command("rebuild")
+@click.option("--k-factor", type=float, help="Overrides RATING_K_FACTOR.")
+@click.option("--initial", type=int, help="Overrides RATING_INITIAL.")
+def rebuild_ratings(k_factor, initial):
+    """Re-rate every player by replaying the match history."""
+    from controllers.rating_controller import RatingService
+
+    players = RatingService(k_factor=k_factor, initial=initial).rebuild()
+    click.echo(f"Rebuilt ratings of {players} players.")
+
+
+def register_commands(app):
+    """Attach the project's ``flask`` CLI command groups to ``app``."""
+    app.cli.add_command(stats_cli)
+    app.cli.add_command(ratings_cli)
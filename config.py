@@ -16,6 +16,42 @@ class Config(object):
     SECRET_KEY = "just_play"
     SQLALCHEMY_DATABASE_URI = f"sqlite:///production.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # SQLite performance profile, applied to every new connection.
+    # Set any of them to None to keep the SQLite default.
+    SQLITE_JOURNAL_MODE = "WAL"
+    SQLITE_SYNCHRONOUS = "NORMAL"
+    SQLITE_BUSY_TIMEOUT = 5000  # ms
+    SQLITE_MMAP_SIZE = 256 * 1024 * 1024  # bytes
+    SQLITE_CACHE_SIZE = -64000  # negative value is KiB, i.e. ~64 MB
+    SQLITE_TEMP_STORE = "MEMORY"
+    # Seconds between keep-alive comments on match event streams
+    SSE_HEARTBEAT_INTERVAL = 15
+    # "auto" uses orjson when it is installed, "orjson" or "default" force one
+    JSON_PROVIDER = "auto"
+    # Elo parameters; run `flask ratings rebuild` after changing them
+    RATING_K_FACTOR = 32
+    RATING_INITIAL = 1500
+    # Run periodic jobs in a background thread of every app process; a job
+    # lease makes sure only one process runs each job anyway. Turn it off in
+    # web workers (FLASK_SCHEDULER_ENABLED=false) to use `python -m scheduler`.
+    SCHEDULER_ENABLED = True
+    SCHEDULER_LEASE_TTL = 300  # seconds
+    # Apply Alembic migrations in create_app. Turn it off in workers
+    # (FLASK_RUN_MIGRATIONS=false) and run `flask db upgrade` once per deploy.
+    RUN_MIGRATIONS = True
+    # "otlp" pushes to OTLP_ENDPOINT, "prometheus" serves /metrics (needs
+    # opentelemetry-exporter-prometheus), "none" disables telemetry export
+    TELEMETRY_EXPORTER = "otlp"
+    OTLP_ENDPOINT = "http://localhost:4318"
+    # Opt-in SQL profiling of every request: query count and SQL time as
+    # metrics (and X-Query-* headers in debug mode), slow statements logged.
+    # QUERY_BUDGETS maps endpoint names (see `flask routes`) to a query limit
+    # overriding QUERY_BUDGET; None disables the check.
+    QUERY_PROFILER = False
+    QUERY_PROFILER_SLOWEST = 3
+    SLOW_QUERY_MS = 100
+    QUERY_BUDGET = 50
+    QUERY_BUDGETS = {}
     API_TITLE = "Billjard backend API"
     API_VERSION = "v1"
     OPENAPI_VERSION = "3.0.2"
@@ -38,6 +74,8 @@ class TestConfig(Config):
     TESTING = True
     LOG_LEVEL = logging.DEBUG
     SQLALCHEMY_DATABASE_URI = "sqlite:///testing.db"
+    SCHEDULER_ENABLED = False
+    TELEMETRY_EXPORTER = "none"
     SQLALCHEMY_TRACK_MODIFICATIONS = True
     LOG_FORMAT = "[BACKEND - Test] %(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
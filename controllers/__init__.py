@@ -1,5 +1,5 @@
 from .event_controller import EventService
-from .game_controller import MatchService
+from .game_controller import GameService, MatchService
 
 import logging
 
@@ -0,0 +1,83 @@
+import queue
+import threading
+from collections import defaultdict
+
+from utils import log
+
+
+class Subscription:
+    """One viewer's buffer of pending Server-Sent Events messages."""
+
+    def __init__(self, match_id, max_pending):
+        self.match_id = match_id
+        self.closed = False
+        self._queue = queue.Queue(maxsize=max_pending)
+
+    def put(self, message):
+        self._queue.put_nowait(message)
+
+    def get(self, timeout=None):
+        """Next message, or ``None`` if nothing arrived within ``timeout``."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class MatchBroadcaster:
+    """
+    In-process pub/sub fan-out of match updates.
+
+    ``MatchEventService`` publishes once per committed change and every
+    subscriber of that match receives the same pre-rendered message, so N
+    viewers cost one state computation per shot. A viewer that falls more
+    than ``max_pending`` messages behind is dropped and has to reconnect to
+    get a fresh state. Subscribers only see events committed by the same
+    process.
+    """
+
+    def __init__(self, max_pending=100):
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, match_id):
+        subscription = Subscription(match_id, self.max_pending)
+        with self._lock:
+            self._subscribers[match_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.match_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.match_id]
+
+    def has_subscribers(self, match_id):
+        return match_id in self._subscribers
+
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def publish(self, match_id, message):
+        with self._lock:
+            subscribers = list(self._subscribers.get(match_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.put(message)
+            except queue.Full:
+                log.warning(f"Dropping slow stream subscriber of match {match_id}")
+                subscription.closed = True
+                self.unsubscribe(subscription)
+        return len(subscribers)
+
+
+def format_sse(event, data):
+    """Render one Server-Sent Events message with an already encoded payload."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+broadcaster = MatchBroadcaster()
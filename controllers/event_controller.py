@@ -1,56 +1,63 @@
 import logging
 
-from flask import jsonify
+from flask_smorest import abort
+
+from controllers.game_controller import GameService, MatchService
+from controllers.match_controller import MatchEventService
+from decorators import make_envelope
 
 
 class EventService:
-    def __init__(self, json_data, client):
+    """
+    Turns global ``/api/event`` requests into calls on the game and match
+    services. The services run in-process and return plain Python objects,
+    so no second request goes through the Flask stack.
+    """
+
+    def __init__(
+        self,
+        json_data,
+        game_service=None,
+        match_service=None,
+        match_event_service=None,
+    ):
         self.json_data = json_data
-        self.client = client
+        self.game_service = game_service or GameService()
+        self.match_service = match_service or MatchService()
+        self.match_event_service = match_event_service or MatchEventService()
 
     def handle_start_game(self):
-        response = self.client.post(
-            "/api/game",
-            json={
+        game = self.game_service.create_game(
+            {
                 "player1_id": self.json_data.get("player1_id"),
                 "player2_id": self.json_data.get("player2_id"),
-            },
+            }
         )
-        resp = response.get_json()
+        resp = make_envelope(game, 201)
         logging.debug(resp)
         resp["event_type"] = "start_game"
         return resp
 
     def handle_start_play(self):
-        response = self.client.post(
-            f"/api/game/{self.json_data.get('game_id')}/match",
-        )
-        resp = response.get_json()
+        try:
+            match_id = self.match_service.start_match(self.json_data.get("game_id"))
+        except ValueError as e:
+            abort(400, message=str(e))
+        resp = make_envelope({"match_id": str(match_id)}, 201)
         resp["event_type"] = "start_play"
         return resp
 
     def handle_player_scored(self):
-        response = self.client.post(
-            f"/api/match/{self.json_data.get('game_id')}/match/{self.json_data.get('play_id')}",
-            json={
-                "player_id": self.json_data.get("player_id"),
-                "event_type": self.json_data.get("event_eventtype"),
+        match_state = self.match_event_service.process_event(
+            game_type="8ball",
+            event_type="BALL_POTTED",
+            data={
                 "ball_number": self.json_data.get("ball_number"),
+                "pocket_id": self.json_data.get("pocket_id"),
             },
+            match_id=self.json_data.get("play_id"),
+            write=True,
         )
-        return response
-
-    def handle_end_party(self):
-        response = self.client.get(f"/winreasons/{self.json_data.get('win_reason_id')}")
-        if response.status_code != 200:
-            return jsonify({"error": "Invalid win reason"}), 400
-        win_reason = response.get_json()
-
-        response = self.client.put(
-            f"/parties/{self.json_data.get('party_id')}/end",
-            json={
-                "winner_id": self.json_data.get("winner_id"),
-                "win_reason_id": self.json_data.get("win_reason_id"),
-            },
-        )
-        return response
+        resp = make_envelope({"event": match_state}, 200)
+        resp["event_type"] = "player_scored"
+        return resp
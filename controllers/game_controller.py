@@ -5,10 +5,34 @@ from sqlalchemy.exc import IntegrityError
 from extensions import db
 from models import Match, Game
 from models.match import MatchStatus
+from schemas import GameSchema
 from schemas.match import MatchSchema
 from utils import log
 
 
+class GameService:
+    game_schema = GameSchema(session=db.session)
+
+    def create_game(self, data):
+        log.info(f"{__name__} - start creating 'game'")
+        try:
+            new_game = self.game_schema.load(data)
+            db.session.add(new_game)
+            db.session.commit()
+            log.info(f"Game added: {new_game}")
+            return self.game_schema.dump(new_game)
+        except ValidationError as err:
+            log.error(f"Validation error: {err}")
+            abort(400, message=f"Validation Error: {err}")
+        except IntegrityError as e:
+            db.session.rollback()
+            log.error(f"IntegrityError: {e.orig}")
+            abort(400, message=f"IntegrityError: {str(e.orig)}")
+        except Exception as e:
+            log.error(f"Unexpected error: {e}")
+            abort(500, message="An unexpected error occurred")
+
+
 class MatchService:
     match_schema = MatchSchema()
     matches_schema = MatchSchema(many=True)
@@ -20,7 +44,9 @@ class MatchService:
         if not match_game:
             log.debug("No active match found.")
             game = Game.query.filter(Game.id == game_id).first()
-            return self._create_match(game_id, game)
+            if game is None:
+                raise ValueError("Game not found.")
+            return self._create_match(game_id, game=game)
 
         if self._is_active_match(game_id):
             log.debug("Active match found.")
@@ -1,20 +1,32 @@
-import json
-import os
+import copy
 
-from flask import jsonify
+from flask import current_app
 from flask_smorest import abort
 from marshmallow import ValidationError
+from sqlalchemy.orm import joinedload, selectinload
 
 from extensions import db
 from models import Event, EventType
-from models.events import FoulEventData, BallPottedEventData, HitBallEventData
-from models.match import MatchStatus, Match
+from models.events import FoulEventData, BallPottedEventData
+from models.match import MatchStatus, Match, MatchStateSnapshot
 from schemas.events import (
     EventSchema,
     FoulEventSchema,
     BallPottedEventSchema,
     HitBallEventSchema,
 )
+from controllers.broadcast import broadcaster, format_sse
+from controllers.rules import rules_cache
+from controllers.rating_controller import RatingService
+from controllers.stats_controller import PlayerStatsService
+from metrics import (
+    match_event_db_statements,
+    match_event_phase,
+    match_events_replayed,
+    statement_count,
+    tracer,
+)
+from schemas.registry import get_schema
 from utils import log
 
 
@@ -24,11 +36,9 @@ class MatchEventService:
     """
     HitBallEvent = HitBallEventSchema
 
-    def __init__(self):
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        rules_path = os.path.join(base_dir, "../static/rules.json")
-        with open(rules_path) as f:
-            self.rules = json.load(f)
+    @property
+    def rules(self):
+        return rules_cache.get()
 
     def get_match_log(self, match_id):
         events = (
@@ -36,109 +46,217 @@ class MatchEventService:
             .order_by(Event.timestamp.asc())
             .all()
         )
-        values = EventSchema.dump(EventSchema(), events, many=True)
+        values = get_schema(EventSchema, many=True).dump(events)
         return values
 
     def process_event(self, game_type, event_type, data, match_id, write=None):
         log.debug(f"Processing event for {match_id} - {event_type} with {data}")
         log.debug(f"process_event - {event_type}")
+        with tracer.start_as_current_span(
+            "match_event.process_event",
+            attributes={"match.id": match_id, "match.event_type": str(event_type)},
+        ) as span, statement_count() as statements:
+            try:
+                with match_event_phase("schema_load"):
+                    validated_data = self._load_event_data(event_type, data)
+            except ValidationError as err:
+                abort(400, message=err.messages)
+
+            match_state = self._load_match_state(game_type, match_id)
+            previous_state = self._copy_for_subscribers(match_id, match_state)
+            with match_event_phase("apply"):
+                match_state = self._apply_event(
+                    match_id=match_id,
+                    match_state=match_state,
+                    event_type=event_type.upper(),
+                    data=validated_data,
+                    write=write,
+                )
+            result = self._event_result(match_id, event_type, match_state)
+            with match_event_phase("win_check"):
+                finished = self._check_win_condition(match_state, game_type)
+            if finished:
+                with match_event_phase("finalize"):
+                    self._finalize_match(match_id, match_state)
+            if write:
+                self._publish(match_id, previous_state, match_state, [result])
+            self._record_statements(span, statements, "process_event")
+        return match_state
+
+    def get_match_state(self, game_type, match_id):
+        """
+        :return: current match state and the id of the last event folded
+            into its snapshot (``None`` if the match has no snapshot yet)
+        """
+        match_state = self._load_match_state(game_type, match_id)
+        snapshot = db.session.get(MatchStateSnapshot, match_id)
+        return match_state, snapshot.last_event_id if snapshot else None
+
+    def process_events(self, game_type, events, match_id):
+        """
+        Apply an ordered batch of events to a single reconstructed state.
+
+        Every event is validated before anything is written, and all of them
+        are committed in one transaction: either the whole batch is stored or
+        none of it is.
+
+        :return: final match state and one result per event
+        """
+        log.debug(f"Processing batch of {len(events)} events for {match_id}")
+        if not events:
+            abort(400, message="No events provided")
+
+        with tracer.start_as_current_span(
+            "match_event.process_events",
+            attributes={"match.id": match_id, "match.batch_size": len(events)},
+        ) as span, statement_count() as statements:
+            validated = []
+            errors = {}
+            with match_event_phase("schema_load"):
+                for index, event in enumerate(events):
+                    event_type = event.get("event_type")
+                    try:
+                        validated.append(
+                            (
+                                event_type,
+                                self._load_event_data(event_type, event.get("data")),
+                            )
+                        )
+                    except ValidationError as err:
+                        errors[index] = err.messages
+            if errors:
+                abort(400, message=errors)
+
+            match_state = self._load_match_state(game_type, match_id)
+            previous_state = self._copy_for_subscribers(match_id, match_state)
+            results = []
+            try:
+                with match_event_phase("apply"):
+                    for event_type, data in validated:
+                        match_state = self._apply_event(
+                            match_id=match_id,
+                            match_state=match_state,
+                            event_type=event_type.upper(),
+                            data=data,
+                            write=False,
+                        )
+                        results.append(
+                            self._event_result(match_id, event_type, match_state)
+                        )
+                with match_event_phase("win_check"):
+                    finished = self._check_win_condition(match_state, game_type)
+                if finished:
+                    with match_event_phase("finalize"):
+                        self._finalize_match(match_id, match_state)
+                else:
+                    with match_event_phase("commit"):
+                        db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            self._publish(match_id, previous_state, match_state, results)
+            self._record_statements(span, statements, "process_events")
+        return match_state, results
+
+    @staticmethod
+    def _record_statements(span, statements, operation):
+        span.set_attribute("db.statements", statements[0])
+        match_event_db_statements.record(statements[0], {"operation": operation})
+
+    def _event_result(self, match_id, event_type, match_state):
+        snapshot = db.session.get(MatchStateSnapshot, match_id)
+        return {
+            "event_id": snapshot.last_event_id,
+            "event_type": event_type,
+            "description": match_state.get("description"),
+        }
+
+    def _copy_for_subscribers(self, match_id, match_state):
+        # Копия нужна только для вычисления дельты, если кто-то подписан
+        if broadcaster.has_subscribers(match_id):
+            return copy.deepcopy(match_state)
+        return None
+
+    def _publish(self, match_id, previous_state, match_state, results):
+        """Push committed events and the changed state keys to stream viewers."""
+        if previous_state is None:
+            return
+        delta = {
+            key: value
+            for key, value in match_state.items()
+            if key not in previous_state or previous_state[key] != value
+        }
+        message = format_sse(
+            "update", current_app.json.dumps({"events": results, "delta": delta})
+        )
+        broadcaster.publish(match_id, message)
+
+    def _load_event_data(self, event_type, data):
         if event_type == "HIT_BALL":
-            schema = HitBallEventSchema()
+            schema = get_schema(HitBallEventSchema)
         elif event_type == "BALL_POTTED":
-            schema = BallPottedEventSchema()
+            schema = get_schema(BallPottedEventSchema)
         elif event_type == "FOUL":
-            schema = FoulEventSchema()
+            schema = get_schema(FoulEventSchema)
         else:
             abort(400, message=f"Unsupported event type: {event_type}")
-
-        try:
-            validated_data = schema.load(data, session=db.session)
-        except ValidationError as err:
-            abort(400, message=err.messages)
-
-        events = (
-            Event.query.filter(Event.match_id == match_id)
-            .order_by(Event.timestamp.asc())
-            .all()
-        )
-        if len(events) == 0:
-            match_state = {
-                "balls_hit": [],
-                "balls_pocketed": [],
-                "current_player_id": None,
-                "turns": [],
-                "fouls": [],
-                "game_status": "ongoing",
-                "winner_id": None,
-                "last_pocketed_ball": None,
-                "target_pocket": None,
-                "description": None,
-            }
-            match_state = self._apply_event(
-                match_id=match_id,
-                match_state=match_state,
-                event_type=event_type.upper(),
-                data=validated_data,
-                write=write,
-                player_id=1,
+        return schema.load(data, session=db.session)
+
+    def _load_match_state(self, game_type, match_id):
+        """
+        Restore match state from the stored snapshot and replay only the
+        events recorded after it.
+        """
+        with match_event_phase("event_fetch"):
+            snapshot = db.session.get(MatchStateSnapshot, match_id)
+            query = Event.query.filter(Event.match_id == match_id)
+            match_state = None
+            if snapshot:
+                query = query.filter(Event.id > snapshot.last_event_id)
+                match_state = copy.deepcopy(snapshot.state)
+            events = (
+                query.options(
+                    joinedload(Event.match),
+                    selectinload(Event.hit_ball_data),
+                    selectinload(Event.ball_potted_data),
+                    selectinload(Event.foul_data),
+                )
+                .order_by(Event.timestamp.asc(), Event.id.asc())
+                .all()
             )
-        else:
-            match_state = self._reconstruct_match_state(events, game_type, match_id)
-            match_state = self._apply_event(
-                match_id=match_id,
-                match_state=match_state,
-                event_type=event_type,
-                data=validated_data,
-                write=write,
+        match_events_replayed.record(len(events))
+        with match_event_phase("replay"):
+            return self._reconstruct_match_state(
+                events, game_type, match_id, match_state=match_state
             )
-        if self._check_win_condition(match_state, game_type):
-            self._finalize_match(match_id, match_state)
-        return match_state
 
-    def validate_event(self, match_id, game_type, event_type, data):
-        # Получение правил для конкретного типа игры и события
-        game_rules = self.rules.get(game_type)
-        if not game_rules:
-            raise ValueError(f"No rules found for game type: {game_type}")
+    def _store_snapshot(self, match_id, match_state, event):
+        snapshot = db.session.get(MatchStateSnapshot, match_id)
+        if snapshot is None:
+            snapshot = MatchStateSnapshot(match_id=match_id)
+            db.session.add(snapshot)
+        snapshot.last_event_id = event.id
+        snapshot.state = copy.deepcopy(match_state)
 
-        event_rules = game_rules.get(event_type)
-        if not event_rules:
+    def validate_event(self, match_id, game_type, event_type, data):
+        # Правила скомпилированы при загрузке rules.json
+        validator = rules_cache.get_validator(game_type, event_type)
+        if validator is None:
+            if game_type not in self.rules:
+                raise ValueError(f"No rules found for game type: {game_type}")
             raise ValueError(
                 f"No validation rules found for event type: {event_type} in game type: {game_type}"
             )
         log.debug("Event valid")
 
-        # Применение каждого правила валидации
-        for rule in event_rules["validations"]:
-            field = rule["field"]
-            if rule["type"] == "required":
-                self._validate_required(field, data)
-            elif rule["type"] == "range":
-                self._validate_range(field, data, rule["min"], rule["max"])
+        validator(data)
 
         log.info(
             f"Event {event_type} for match {match_id} in game {game_type} passed validation."
         )
 
-    def _validate_required(self, field, data):
-        if field not in data:
-            abort(400, message=f"Field '{field}' is required for this event.")
-
-    def _validate_range(self, field, data, min_value, max_value):
-        if field in data:
-            value = data[field]
-            if not (min_value <= value <= max_value):
-                abort(
-                    400,
-                    message=f"Field '{field}' must be between {min_value} and {max_value}.",
-                )
-        else:
-            abort(400, message=f"Field '{field}' is required for this event.")
-
-    def _reconstruct_match_state(self, events, game_type,  match_id) -> object:
-        log.debug("Reconstructing match...")
-
-        match_state = {
+    def _new_match_state(self):
+        return {
             "balls_hit": [],
             "balls_pocketed": [],
             "current_player_id": None,
@@ -151,9 +269,19 @@ class MatchEventService:
             "description": None,
         }
 
+    def _reconstruct_match_state(
+            self, events, game_type, match_id, match_state=None
+    ) -> object:
+        log.debug(f"Reconstructing match from {len(events)} events...")
+
+        if match_state is None:
+            match_state = self._new_match_state()
+
         for event in events:
+            # Детальные данные подгружаются заранее через selectinload в
+            # _load_match_state, здесь запросов к БД нет
             if event.event_type == EventType.HIT_BALL:
-                hit_data = HitBallEventData.query.filter_by(event_id=event.id).first()
+                hit_data = next(iter(event.hit_ball_data), None)
                 if hit_data:
                     match_state = self._apply_event(
                         match_id=event.match_id,
@@ -161,7 +289,6 @@ class MatchEventService:
                         event_type=event.event_type,
                         data={
                             "ball_number": hit_data.ball_number,
-                            "force": hit_data.force,
                             "description": event.description,
                         },
                         player_id=event.player_id,
@@ -170,9 +297,7 @@ class MatchEventService:
                     )
 
             elif event.event_type == EventType.BALL_POTTED:
-                potted_data = BallPottedEventData.query.filter_by(
-                    event_id=event.id
-                ).first()
+                potted_data = next(iter(event.ball_potted_data), None)
                 if potted_data:
                     match_state = self._apply_event(
                         match_id=event.match_id,
@@ -189,7 +314,7 @@ class MatchEventService:
                     )
 
             elif event.event_type == EventType.FOUL:
-                foul_data = FoulEventData.query.filter_by(event_id=event.id).first()
+                foul_data = next(iter(event.foul_data), None)
                 if foul_data:
                     match_state = self._apply_event(
                         match_id=event.match_id,
@@ -230,7 +355,8 @@ class MatchEventService:
             )
             try:
                 db.session.add(new_event)
-                db.session.flush()  # Получаем ID для нового события до его использования в связанных таблицах
+                with match_event_phase("flush"):
+                    db.session.flush()  # Получаем ID для нового события до его использования в связанных таблицах
             except Exception as e:
                 log.error(f"Error while adding new event: {e}")
                 db.session.rollback()
@@ -240,7 +366,7 @@ class MatchEventService:
 
         # Обработка типов событий
         if event_type == "HIT_BALL":
-            log.debug(HitBallEventSchema.dump(self.HitBallEvent(),obj=data))
+            log.debug(get_schema(self.HitBallEvent).dump(data))
             if isinstance(data, dict):
                 balls_hit = data.get("ball_number", [])
                 balls_pocketed = data.get("balls_pocketed", {})
@@ -321,10 +447,15 @@ class MatchEventService:
                 new_event.description = description
             match_state["description"] = description
 
+        # Снимок состояния пишется в той же транзакции, что и событие
+        if not reconstructing:
+            self._store_snapshot(match_id, match_state, new_event)
+
         # Запись события в базу данных
         if write and not reconstructing:
             try:
-                db.session.commit()
+                with match_event_phase("commit"):
+                    db.session.commit()
                 log.debug("Event committed to DB successfully")
             except Exception as e:
                 log.error(f"Error committing event to DB: {e}")
@@ -342,29 +473,35 @@ class MatchEventService:
         return False
 
     def _finalize_match(self, match_id, match_state):
-        # Обновление статуса матча
-        match = Match.query.get(match_id)
+        # Обновление статуса матча, профилей и статистики в одной транзакции
+        match = db.session.get(Match, match_id)
+        if match.status == MatchStatus.COMPLETED:
+            # Уже завершён: не начислять результат, рейтинг и статистику повторно
+            return
         match.status = MatchStatus.COMPLETED
-        winner = self._determine_winner(match_state)
-        match.winner = winner
-        self._update_player_profiles(match.player1, match.player2, winner)
+        match.winner_id = self._determine_winner(match, match_state)
+        self._update_player_profiles(
+            match.player1_relation, match.player2_relation, match.winner_id
+        )
+        RatingService().record_match(match)
+        PlayerStatsService().record_match(match)
         db.session.commit()
 
-    def _determine_winner(self, match_state):
-        return "player1"
+    def _determine_winner(self, match, match_state):
+        return match.player1_id
 
-    def _update_player_profiles(self, player1, player2, winner):
+    def _update_player_profiles(self, player1, player2, winner_id):
         # Логика обновления профилей игроков
-        if winner == player1:
-            player1.wins += 1
-            player2.losses += 1
+        if winner_id == player1.id:
+            player1.wins = (player1.wins or 0) + 1
+            player2.losses = (player2.losses or 0) + 1
         else:
-            player1.losses += 1
-            player2.wins += 1
-        db.session.commit()
+            player1.losses = (player1.losses or 0) + 1
+            player2.wins = (player2.wins or 0) + 1
 
     def _get_next_player(self, player_id: object, match_id: int) -> object:
-        match = Match.query.filter(Match.id == match_id).first()
+        # session.get отдаёт матч из identity map без повторного запроса
+        match = db.session.get(Match, match_id)
         log.debug(f'Getting next player: Was {player_id}')
         if player_id == match.player1_id:
             return match.player2_id
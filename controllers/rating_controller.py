@@ -0,0 +1,110 @@
+from flask import current_app
+from sqlalchemy import update
+
+from extensions import db
+from models import Match, Player
+from models.match import MatchStatus
+from utils import log
+
+
+def expected_score(rating, opponent_rating):
+    """Probability that a player rated ``rating`` beats ``opponent_rating``."""
+    return 1.0 / (1.0 + 10.0 ** ((opponent_rating - rating) / 400.0))
+
+
+class RatingService:
+    """
+    Elo ratings stored in ``Player.score``.
+
+    ``record_match`` updates both players when a match is finalized and
+    ``rebuild`` re-rates the whole league from the match history, e.g. after
+    ``RATING_K_FACTOR`` changes. ``Player.rated_matches`` counts rated matches;
+    a player without any starts at ``RATING_INITIAL``. Ratings are rounded
+    to whole points after every match in both modes, so a rebuild reproduces
+    the incremental ratings exactly.
+    """
+
+    def __init__(self, k_factor=None, initial=None):
+        self.k_factor = (
+            k_factor if k_factor is not None else current_app.config["RATING_K_FACTOR"]
+        )
+        self.initial = (
+            initial if initial is not None else current_app.config["RATING_INITIAL"]
+        )
+
+    def rating(self, player):
+        return player.score if player.rated_matches else self.initial
+
+    def play(self, rating1, rating2, player1_won):
+        """:return: new ``(rating1, rating2)`` after one match, rounded."""
+        delta = self.k_factor * (player1_won - expected_score(rating1, rating2))
+        return round(rating1 + delta), round(rating2 - delta)
+
+    def record_match(self, match):
+        """
+        Apply the result of a finalized match to both players.
+
+        Runs inside the caller's transaction and does not commit.
+        """
+        if match.winner_id is None:
+            return
+        player1, player2 = match.player1_relation, match.player2_relation
+        rating1, rating2 = self.rating(player1), self.rating(player2)
+        player1.score, player2.score = self.play(
+            rating1, rating2, match.winner_id == player1.id
+        )
+        for player in (player1, player2):
+            player.rated_matches += 1
+
+    def compute(self, matches):
+        """
+        Replay ``(player1_id, player2_id, winner_id)`` rows in order.
+
+        :return: ``{player_id: (rating, rated_matches)}``
+        """
+        ratings, rated = {}, {}
+        for player1, player2, winner in matches:
+            rating1 = ratings.get(player1, self.initial)
+            rating2 = ratings.get(player2, self.initial)
+            ratings[player1], ratings[player2] = self.play(
+                rating1, rating2, winner == player1
+            )
+            rated[player1] = rated.get(player1, 0) + 1
+            rated[player2] = rated.get(player2, 0) + 1
+        return {player_id: (ratings[player_id], rated[player_id]) for player_id in ratings}
+
+    def rebuild(self):
+        """
+        Recompute every rating from completed matches and persist them in
+        bulk in one transaction, so readers keep the old ratings until commit.
+
+        :return: number of players with a rated match
+        """
+        log.info(
+            f"Rebuilding ratings (K={self.k_factor}, initial={self.initial})..."
+        )
+        matches = (
+            db.session.query(Match.player1_id, Match.player2_id, Match.winner_id)
+            .filter(
+                Match.status == MatchStatus.COMPLETED,
+                Match.winner_id.isnot(None),
+                Match.player1_id.isnot(None),
+                Match.player2_id.isnot(None),
+            )
+            .order_by(Match.match_date.asc(), Match.id.asc())
+            .all()
+        )
+        ratings = self.compute([tuple(row) for row in matches])
+
+        db.session.execute(update(Player).values(score=self.initial, rated_matches=0))
+        if ratings:
+            db.session.execute(
+                update(Player),
+                [
+                    {"id": player_id, "score": rating, "rated_matches": rated}
+                    for player_id, (rating, rated) in ratings.items()
+                ],
+            )
+        db.session.commit()
+        log.info(f"Ratings rebuilt from {len(matches)} matches for {len(ratings)} players.")
+        return len(ratings)
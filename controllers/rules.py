@@ -0,0 +1,125 @@
+import json
+import os
+import threading
+import time
+from types import MappingProxyType
+
+from flask_smorest import abort
+
+from utils import log
+
+RULES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "../static/rules.json"
+)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def compile_validator(validations):
+    """
+    Fold a ``validations`` list into one callable.
+
+    Range bounds and the set of required fields are resolved here, so
+    validating an event is one subset check plus one comparison per range.
+    Unknown rule types raise ``ValueError`` instead of being skipped later.
+    """
+    required = []
+    ranges = []
+    for rule in validations:
+        field = rule["field"]
+        if rule["type"] == "required":
+            required.append(field)
+        elif rule["type"] == "range":
+            ranges.append((field, rule["min"], rule["max"]))
+        else:
+            raise ValueError(f"Unknown validation rule type: {rule['type']}")
+
+    # range implies the field is present, as the original checks did
+    required.extend(field for field, _, _ in ranges if field not in required)
+    required = tuple(required)
+    required_set = frozenset(required)
+    ranges = tuple(ranges)
+
+    def validator(data):
+        if not data.keys() >= required_set:
+            field = next(field for field in required if field not in data)
+            abort(400, message=f"Field '{field}' is required for this event.")
+        for field, min_value, max_value in ranges:
+            if not (min_value <= data[field] <= max_value):
+                abort(
+                    400,
+                    message=f"Field '{field}' must be between {min_value} and {max_value}.",
+                )
+
+    return validator
+
+
+def compile_rules(rules):
+    return {
+        (game_type, event_type): compile_validator(event_rules["validations"])
+        for game_type, game_rules in rules.items()
+        for event_type, event_rules in game_rules.items()
+    }
+
+
+class RulesCache:
+    """
+    Process-wide, read-only view of ``static/rules.json``.
+
+    The file is parsed once and shared by every request, together with a
+    validator compiled for each (game type, event type). Its mtime is checked
+    at most once per ``check_interval`` seconds and the rules are re-parsed
+    only when it changes, so the event path normally never touches the disk.
+    """
+
+    def __init__(self, path=RULES_PATH, check_interval=2.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._rules = None
+        self._validators = None
+        self._mtime = None
+        self._checked_at = 0.0
+
+    def get(self):
+        if (
+            self._rules is None
+            or time.monotonic() - self._checked_at >= self.check_interval
+        ):
+            self._refresh()
+        return self._rules
+
+    def get_validator(self, game_type, event_type):
+        self.get()
+        return self._validators.get((game_type, event_type))
+
+    def _refresh(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._rules is not None and now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+                if mtime == self._mtime:
+                    return
+                with open(self.path) as f:
+                    rules = _freeze(json.load(f))
+                validators = compile_rules(rules)
+            except (OSError, KeyError, ValueError) as e:
+                if self._rules is None:
+                    raise
+                log.error(f"Keeping previous rules, reload of {self.path} failed: {e}")
+                return
+            self._rules, self._validators = rules, validators
+            self._mtime = mtime
+            log.info(f"Rules loaded from {self.path}")
+
+
+rules_cache = RulesCache()
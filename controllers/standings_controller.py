@@ -0,0 +1,243 @@
+from collections import Counter, defaultdict
+from itertools import groupby
+
+from flask_smorest import abort
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import aliased, joinedload
+
+from extensions import db
+from models import Game, Tournament, TournamentParticipant, TournamentStanding
+from models.game import GameStatus
+
+Standing = TournamentStanding
+
+
+class StandingsService:
+    """
+    Tournament standings served from the ``tournament_standings`` cache.
+
+    Finishing a game touches the two players and the previous opponents of
+    the winner, whose Buchholz (and Sonneborn-Berger, if they beat the
+    winner) grows by the point just scored. Head-to-head only breaks ties
+    that remain after points, Buchholz and Sonneborn-Berger, so it is
+    computed when standings are read, for the tied players only.
+    """
+
+    def initialize(self, tournament_id, player_ids):
+        """Create empty rows for players that do not have one yet."""
+        existing = {
+            player_id
+            for (player_id,) in db.session.query(Standing.player_id).filter(
+                Standing.tournament_id == tournament_id
+            )
+        }
+        db.session.add_all(
+            self._empty_row(tournament_id, player_id)
+            for player_id in dict.fromkeys(player_ids)
+            if player_id not in existing
+        )
+        db.session.flush()
+
+    def record_game(self, game):
+        """Apply a finished tournament game. Does not commit."""
+        tournament_id, winner = game.tournament_id, game.winner_id
+        if game.player2_id is None:
+            return self.record_bye(tournament_id, winner)
+
+        loser = game.player2_id if winner == game.player1_id else game.player1_id
+        self.initialize(tournament_id, (winner, loser))
+        self._add_point(tournament_id, winner, exclude_game_id=game.id)
+        self._update(
+            tournament_id,
+            [winner],
+            played=Standing.played + 1,
+            wins=Standing.wins + 1,
+            buchholz=Standing.buchholz + self._points_of(tournament_id, loser),
+            sonneborn_berger=Standing.sonneborn_berger
+            + self._points_of(tournament_id, loser),
+        )
+        self._update(
+            tournament_id,
+            [loser],
+            played=Standing.played + 1,
+            losses=Standing.losses + 1,
+            buchholz=Standing.buchholz + self._points_of(tournament_id, winner),
+        )
+
+    def record_bye(self, tournament_id, player_id):
+        """A bye is worth a point but is not an opponent for tiebreaks."""
+        self.initialize(tournament_id, (player_id,))
+        self._update(tournament_id, [player_id], byes=Standing.byes + 1)
+        self._add_point(tournament_id, player_id)
+
+    def recompute(self, tournament_id):
+        """
+        Rebuild the rows of a tournament from its finished games.
+
+        :return: number of rows written
+        """
+        player_ids = [
+            player_id
+            for (player_id,) in db.session.query(
+                TournamentParticipant.player_id
+            ).filter(TournamentParticipant.tournament_id == tournament_id)
+        ]
+        games = db.session.query(
+            Game.player1_id, Game.player2_id, Game.winner_id
+        ).filter(
+            Game.tournament_id == tournament_id,
+            Game.status == GameStatus.COMPLETED,
+            Game.winner_id.isnot(None),
+        )
+
+        rows = {}
+        opponents, beaten = defaultdict(list), defaultdict(list)
+        for player1, player2, winner in games:
+            for player_id in (player1, player2):
+                if player_id is not None and player_id not in rows:
+                    rows[player_id] = self._empty_row(tournament_id, player_id)
+            rows[winner].points += 1
+            if player2 is None:
+                rows[winner].byes += 1
+                continue
+            loser = player2 if winner == player1 else player1
+            rows[winner].wins += 1
+            rows[loser].losses += 1
+            for player_id in (player1, player2):
+                rows[player_id].played += 1
+            opponents[winner].append(loser)
+            opponents[loser].append(winner)
+            beaten[winner].append(loser)
+
+        for player_id in player_ids:
+            rows.setdefault(player_id, self._empty_row(tournament_id, player_id))
+        for player_id, row in rows.items():
+            row.buchholz = sum(
+                rows[opponent].points for opponent in opponents[player_id]
+            )
+            row.sonneborn_berger = sum(
+                rows[opponent].points for opponent in beaten[player_id]
+            )
+
+        db.session.query(Standing).filter(
+            Standing.tournament_id == tournament_id
+        ).delete()
+        db.session.add_all(rows.values())
+        db.session.commit()
+        return len(rows)
+
+    def standings(self, tournament_id):
+        """
+        Ranked rows of a tournament, each with ``rank`` and ``head_to_head``
+        (wins against the players it is otherwise tied with).
+        """
+        if db.session.get(Tournament, tournament_id) is None:
+            abort(404, message="Tournament not found")
+        rows = (
+            Standing.query.options(joinedload(Standing.player))
+            .filter(Standing.tournament_id == tournament_id)
+            .order_by(
+                Standing.points.desc(),
+                Standing.buchholz.desc(),
+                Standing.sonneborn_berger.desc(),
+                Standing.player_id.asc(),
+            )
+            .all()
+        )
+        ranked = []
+        for _, tied in groupby(
+            rows, key=lambda row: (row.points, row.buchholz, row.sonneborn_berger)
+        ):
+            tied = list(tied)
+            wins = self._head_to_head(tournament_id, [row.player_id for row in tied])
+            for row in tied:
+                row.head_to_head = wins[row.player_id]
+            ranked.extend(sorted(tied, key=lambda row: -row.head_to_head))
+        for rank, row in enumerate(ranked, start=1):
+            row.rank = rank
+        return ranked
+
+    def _head_to_head(self, tournament_id, player_ids):
+        wins = Counter()
+        if len(player_ids) < 2:
+            return wins
+        games = db.session.query(Game.winner_id).filter(
+            Game.tournament_id == tournament_id,
+            Game.status == GameStatus.COMPLETED,
+            Game.player1_id.in_(player_ids),
+            Game.player2_id.in_(player_ids),
+        )
+        wins.update(winner for (winner,) in games)
+        return wins
+
+    def _add_point(self, tournament_id, player_id, exclude_game_id=None):
+        self._update(tournament_id, [player_id], points=Standing.points + 1)
+
+        query = db.session.query(
+            Game.id, Game.player1_id, Game.player2_id, Game.winner_id
+        ).filter(
+            Game.tournament_id == tournament_id,
+            Game.status == GameStatus.COMPLETED,
+            Game.player2_id.isnot(None),
+            or_(Game.player1_id == player_id, Game.player2_id == player_id),
+        )
+        met, beaten_by = Counter(), Counter()
+        for game_id, player1, player2, winner in query:
+            if game_id == exclude_game_id:
+                continue
+            opponent = player2 if player1 == player_id else player1
+            met[opponent] += 1
+            if winner == opponent:
+                beaten_by[opponent] += 1
+
+        # Opponents met more than once (Swiss rematches) get one update per count
+        for times, opponents in self._by_count(met):
+            self._update(tournament_id, opponents, buchholz=Standing.buchholz + times)
+        for times, opponents in self._by_count(beaten_by):
+            self._update(
+                tournament_id,
+                opponents,
+                sonneborn_berger=Standing.sonneborn_berger + times,
+            )
+
+    @staticmethod
+    def _by_count(counter):
+        grouped = defaultdict(list)
+        for player_id, times in counter.items():
+            grouped[times].append(player_id)
+        return grouped.items()
+
+    @staticmethod
+    def _update(tournament_id, player_ids, **values):
+        db.session.execute(
+            update(Standing)
+            .where(
+                Standing.tournament_id == tournament_id,
+                Standing.player_id.in_(player_ids),
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _points_of(tournament_id, player_id):
+        other = aliased(Standing)
+        return (
+            select(other.points)
+            .where(other.tournament_id == tournament_id, other.player_id == player_id)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _empty_row(tournament_id, player_id):
+        return Standing(
+            tournament_id=tournament_id,
+            player_id=player_id,
+            played=0,
+            wins=0,
+            losses=0,
+            byes=0,
+            points=0,
+            buchholz=0,
+            sonneborn_berger=0,
+        )
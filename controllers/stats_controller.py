@@ -0,0 +1,184 @@
+import marshmallow as ma
+from sqlalchemy import and_, case, func, insert, literal, or_, select, union_all
+from sqlalchemy.orm import joinedload
+
+from extensions import db
+from models import Game, Match, PlayerStats
+from models.match import MatchStatus
+from pagination import DEFAULT_LIMIT, MAX_LIMIT, NEXT_CURSOR_HEADER
+from schemas.registry import get_schema
+from schemas.stats import PlayerStatsSchema
+from utils import log
+
+SEASON = "season"
+CLUB = "club"
+
+
+class LeaderboardArgsSchema(ma.Schema):
+    """
+    Query arguments of leaderboards, which are ordered by wins rather than
+    by primary key. ``after`` is the ``<wins>.<player_id>`` cursor returned
+    in the ``X-Next-Cursor`` header of the previous page.
+    """
+
+    class Meta:
+        unknown = ma.EXCLUDE
+
+    limit = ma.fields.Integer(
+        load_default=DEFAULT_LIMIT, validate=ma.validate.Range(min=1, max=MAX_LIMIT)
+    )
+    after = ma.fields.String(
+        load_default=None, validate=ma.validate.Regexp(r"^\d+\.\d+$")
+    )
+
+    @ma.post_load
+    def split_cursor(self, data, **kwargs):
+        if data["after"] is not None:
+            wins, player_id = data["after"].split(".")
+            data["after"] = (int(wins), int(player_id))
+        return data
+
+
+class PlayerStatsService:
+    """
+    Keeps the materialized ``player_stats`` table in sync with match results
+    and serves leaderboards from it.
+    """
+
+    def record_match(self, match):
+        """
+        Add a completed match to both players' season and club stats.
+
+        Runs inside the caller's transaction and does not commit.
+        """
+        game = match.game
+        scopes = [
+            (scope_type, scope_id)
+            for scope_type, scope_id in ((SEASON, game.season_id), (CLUB, game.club_id))
+            if scope_id is not None
+        ]
+        if not scopes or match.winner_id is None:
+            return
+
+        player_ids = (match.player1_id, match.player2_id)
+        existing = {
+            (stats.scope_type, stats.scope_id, stats.player_id): stats
+            for stats in PlayerStats.query.filter(
+                PlayerStats.player_id.in_(player_ids),
+                or_(
+                    *(
+                        and_(
+                            PlayerStats.scope_type == scope_type,
+                            PlayerStats.scope_id == scope_id,
+                        )
+                        for scope_type, scope_id in scopes
+                    )
+                ),
+            )
+        }
+        for scope_type, scope_id in scopes:
+            for player_id in player_ids:
+                won = int(player_id == match.winner_id)
+                stats = existing.get((scope_type, scope_id, player_id))
+                if stats is None:
+                    db.session.add(
+                        PlayerStats(
+                            scope_type=scope_type,
+                            scope_id=scope_id,
+                            player_id=player_id,
+                            played=1,
+                            wins=won,
+                            losses=1 - won,
+                        )
+                    )
+                else:
+                    # SQL-side increments, so concurrent finishes do not lose updates
+                    stats.played = PlayerStats.played + 1
+                    stats.wins = PlayerStats.wins + won
+                    stats.losses = PlayerStats.losses + 1 - won
+
+    def leaderboard(self, scope_type, scope_id, limit, after=None):
+        """
+        Top players of a season or club, ordered by wins.
+
+        :param after: ``(wins, player_id)`` of the last row of the previous page
+        :return: rows of this page and the cursor of the next one, if any
+        """
+        query = PlayerStats.query.options(joinedload(PlayerStats.player)).filter(
+            PlayerStats.scope_type == scope_type, PlayerStats.scope_id == scope_id
+        )
+        if after is not None:
+            wins, player_id = after
+            query = query.filter(
+                or_(
+                    PlayerStats.wins < wins,
+                    and_(PlayerStats.wins == wins, PlayerStats.player_id > player_id),
+                )
+            )
+        rows = (
+            query.order_by(PlayerStats.wins.desc(), PlayerStats.player_id.asc())
+            .limit(limit + 1)
+            .all()
+        )
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, (rows[-1].wins, rows[-1].player_id)
+        return rows, None
+
+    def leaderboard_page(self, scope_type, scope_id, args):
+        """
+        Dump one leaderboard page of a season or club.
+
+        :param args: arguments loaded with :class:`LeaderboardArgsSchema`
+        :return: ``(data, status_code, headers)`` tuple for ``format_response``
+        """
+        rows, cursor = self.leaderboard(
+            scope_type, scope_id, args["limit"], after=args["after"]
+        )
+        headers = {}
+        if cursor is not None:
+            headers[NEXT_CURSOR_HEADER] = f"{cursor[0]}.{cursor[1]}"
+        return get_schema(PlayerStatsSchema, many=True).dump(rows), 200, headers
+
+    def rebuild(self):
+        """
+        Recompute every row from completed matches with set-based
+        ``INSERT ... SELECT`` statements and commit.
+
+        :return: number of rows written
+        """
+        log.info("Rebuilding player stats from match history...")
+        completed = and_(
+            Match.status == MatchStatus.COMPLETED, Match.winner_id.isnot(None)
+        )
+        sides = union_all(
+            select(
+                Match.game_id, Match.player1_id.label("player_id"), Match.winner_id
+            ).where(completed),
+            select(
+                Match.game_id, Match.player2_id.label("player_id"), Match.winner_id
+            ).where(completed),
+        ).subquery()
+        wins = func.sum(case((sides.c.player_id == sides.c.winner_id, 1), else_=0))
+
+        db.session.query(PlayerStats).delete()
+        rows = 0
+        for scope_type, scope_column in ((SEASON, Game.season_id), (CLUB, Game.club_id)):
+            statement = insert(PlayerStats).from_select(
+                ["scope_type", "scope_id", "player_id", "played", "wins", "losses"],
+                select(
+                    literal(scope_type),
+                    scope_column,
+                    sides.c.player_id,
+                    func.count(),
+                    wins,
+                    func.count() - wins,
+                )
+                .select_from(sides.join(Game, Game.id == sides.c.game_id))
+                .where(scope_column.isnot(None), sides.c.player_id.isnot(None))
+                .group_by(scope_column, sides.c.player_id),
+            )
+            rows += db.session.execute(statement).rowcount
+        db.session.commit()
+        log.info(f"Player stats rebuilt: {rows} rows.")
+        return rows
@@ -0,0 +1,118 @@
+from collections import defaultdict
+from itertools import groupby
+
+from utils import log
+
+
+class SwissStandings:
+    """
+    In-memory index of a Swiss tournament built from its games in one pass:
+    points per player, who they already met and who already had a bye.
+
+    A win and a bye are worth one point. A bye is a completed game without
+    a second player.
+    """
+
+    def __init__(self, player_ids, games):
+        self.points = dict.fromkeys(player_ids, 0)
+        self.opponents = defaultdict(set)
+        self.byes = set()
+        self.rounds = 0
+        for round_number, player1, player2, winner in games:
+            self.rounds = max(self.rounds, round_number or 0)
+            if player2 is None:
+                self.byes.add(player1)
+            else:
+                self.opponents[player1].add(player2)
+                self.opponents[player2].add(player1)
+            if winner is not None and winner in self.points:
+                self.points[winner] += 1
+
+    def ranked(self, ratings):
+        """Player ids by points, then rating, then id."""
+        return sorted(
+            self.points,
+            key=lambda player: (-self.points[player], -(ratings.get(player) or 0), player),
+        )
+
+
+def pair_score_group(pool, opponents):
+    """
+    Pair one score group, Dutch style: the top half meets the bottom half in
+    order, shifting down the bottom half to avoid rematches. Players left
+    over are paired among themselves the same way until no progress is made.
+
+    :param pool: player ids in rank order
+    :return: ``(pairs, floaters)``; floaters drop to the next score group
+    """
+    pairs = []
+    while len(pool) >= 2:
+        half = len(pool) // 2
+        free = pool[half:]
+        unpaired = []
+        for player in pool[:half]:
+            played = opponents[player]
+            for i, candidate in enumerate(free):
+                if candidate not in played:
+                    pairs.append((player, free.pop(i)))
+                    break
+            else:
+                unpaired.append(player)
+        rest = unpaired + free
+        if len(rest) == len(pool):
+            break
+        pool = rest
+    return pairs, pool
+
+
+def swiss_pairings(ranked, points, opponents, byes):
+    """
+    Pair the next Swiss round.
+
+    Score groups are paired from the top down; players that cannot be paired
+    inside their group float down to the next one. With an odd field the
+    lowest ranked player without a bye gets one. Players still unpaired after
+    the last group are swapped into the lowest possible existing pairs, and
+    only paired as a rematch if no swap works.
+
+    :param ranked: player ids in rank order, see :meth:`SwissStandings.ranked`
+    :return: ``(pairs, bye)``
+    """
+    ranked = list(ranked)
+    bye = None
+    if len(ranked) % 2:
+        bye = next(
+            (player for player in reversed(ranked) if player not in byes), ranked[-1]
+        )
+        ranked.remove(bye)
+
+    pairs, floaters = [], []
+    for _, members in groupby(ranked, key=points.__getitem__):
+        group_pairs, floaters = pair_score_group(floaters + list(members), opponents)
+        pairs.extend(group_pairs)
+
+    for player1, player2 in zip(floaters[::2], floaters[1::2]):
+        if player2 not in opponents[player1]:
+            pairs.append((player1, player2))
+        elif not _swap_into(pairs, player1, player2, opponents):
+            log.warning(f"Swiss pairing: rematch of {player1} and {player2}")
+            pairs.append((player1, player2))
+    return pairs, bye
+
+
+def _swap_into(pairs, player1, player2, opponents):
+    """
+    Break the lowest existing pair that lets two players who already met
+    get new opponents instead, e.g. ``(c, d)`` becomes ``(c, player1)`` and
+    ``(d, player2)``.
+
+    :return: ``True`` if a swap was made
+    """
+    for i in range(len(pairs) - 1, -1, -1):
+        first, second = pairs[i]
+        for mate1, mate2 in ((player1, player2), (player2, player1)):
+            if first not in opponents[mate1] and second not in opponents[mate2]:
+                pairs[i] = (first, mate1)
+                pairs.append((second, mate2))
+                return True
+    return False
@@ -0,0 +1,341 @@
+from functools import lru_cache
+from itertools import chain
+
+from flask_smorest import abort
+from sqlalchemy import bindparam, insert
+
+from controllers.standings_controller import StandingsService
+from controllers.swiss import SwissStandings, swiss_pairings
+from extensions import db
+from models import Game, Player
+from models.game import GameStatus
+from models.tounament import (
+    Tournament,
+    TournamentParticipant,
+    TournamentPhase,
+    TournamentType,
+)
+from schemas import GameSchema
+from schemas.registry import get_schema
+from utils import log
+
+# Columns written for every generated game, in the order of the games table
+GAME_COLUMNS = (
+    "season_id",
+    "tournament_id",
+    "round_number",
+    "bracket_position",
+    "player1_id",
+    "player1_score",
+    "player2_id",
+    "player2_score",
+    "winner_id",
+    "status",
+)
+# Rows per multi-row INSERT statement, well below SQLite's bound parameter limit
+INSERT_BATCH = 500
+
+
+@lru_cache(maxsize=16)
+def _multi_row_insert(dialect, size):
+    """
+    ``INSERT INTO games`` of ``size`` rows compiled for ``dialect``.
+
+    SQLAlchemy does not cache multi-row VALUES statements, and compiling one
+    of a few hundred rows takes far longer than running it, so each chunk
+    size is compiled once.
+
+    :return: SQL string and whether the dialect binds parameters by position
+    """
+    statement = insert(Game.__table__).values(
+        [
+            {column: bindparam(f"{column}_{i}") for column in GAME_COLUMNS}
+            for i in range(size)
+        ]
+    )
+    compiled = statement.compile(dialect=dialect)
+    # Positional parameters are bound as the flat tuple of all rows
+    if compiled.positional and compiled.positiontup != [
+        f"{column}_{i}" for i in range(size) for column in GAME_COLUMNS
+    ]:
+        raise RuntimeError("GAME_COLUMNS must follow the column order of games")
+    return str(compiled), compiled.positional
+
+
+def round_robin_rounds(player_ids):
+    """
+    Pair every player with every other one using the circle method.
+
+    The first player stays in place while the others rotate by one seat per
+    round. With an odd number of players a ``None`` seat is added and whoever
+    sits opposite it has a bye that round.
+
+    :return: list of rounds, each a list of ``(player1_id, player2_id, None)``
+    """
+    seats = list(player_ids)
+    if len(seats) % 2:
+        seats.append(None)
+    half = len(seats) // 2
+    rounds = []
+    for number in range(len(seats) - 1):
+        games = []
+        for i in range(half):
+            player1, player2 = seats[i], seats[-1 - i]
+            if player1 is None or player2 is None:
+                continue
+            # Alternate who breaks for the fixed seat so it is not always first
+            if i == 0 and number % 2:
+                player1, player2 = player2, player1
+            games.append((player1, player2, None))
+        rounds.append(games)
+        seats.insert(1, seats.pop())
+    return rounds
+
+
+def seeding_order(size):
+    """
+    Seed numbers in bracket order for a bracket of ``size`` (a power of two),
+    e.g. ``[1, 8, 4, 5, 2, 7, 3, 6]``, so that the top seeds can only meet
+    in the latest rounds.
+    """
+    seeds = [1]
+    while len(seeds) < size:
+        total = 2 * len(seeds) + 1
+        seeds = [seed for top in seeds for seed in (top, total - top)]
+    return seeds
+
+
+def elimination_rounds(player_ids):
+    """
+    Single elimination bracket for players ordered from the top seed down.
+
+    The bracket is padded to the next power of two with byes, which go to
+    the top seeds. A bye is a completed game without a second player. Later
+    rounds are placeholders whose slots are filled as winners are known.
+
+    :return: list of rounds, each a list of ``(player1_id, player2_id, winner_id)``
+    """
+    size = 1
+    while size < len(player_ids):
+        size *= 2
+    seeded = [
+        player_ids[seed - 1] if seed <= len(player_ids) else None
+        for seed in seeding_order(size)
+    ]
+
+    first_round = []
+    for player1, player2 in zip(seeded[::2], seeded[1::2]):
+        first_round.append((player1, player2, player1 if player2 is None else None))
+    rounds = [first_round]
+    while len(rounds[-1]) > 1:
+        previous = rounds[-1]
+        rounds.append(
+            [
+                (previous[i][2], previous[i + 1][2], None)
+                for i in range(0, len(previous), 2)
+            ]
+        )
+    return rounds
+
+
+class TournamentService:
+    """
+    Generates tournament schedules as ``Game`` rows and records their results.
+
+    Rounds are inserted with multi-row INSERT statements; every game stores its
+    ``bracket_position`` within the round, by which elimination winners are
+    advanced.
+    """
+
+    def generate_schedule(self, tournament_id):
+        tournament = self._get_tournament(tournament_id)
+        if (
+            db.session.query(Game.id)
+            .filter(Game.tournament_id == tournament_id)
+            .first()
+        ):
+            abort(409, message="Tournament schedule already exists")
+
+        player_ids = self._seeded_player_ids(tournament_id)
+        if len(player_ids) < 2:
+            abort(400, message="Tournament needs at least two participants")
+
+        if tournament.tournament_type == TournamentType.ROUND_ROBIN:
+            rounds = round_robin_rounds(player_ids)
+            phase = TournamentPhase.GROUP_STAGE
+        elif tournament.tournament_type == TournamentType.ELIMINATION:
+            rounds = elimination_rounds(player_ids)
+            phase = TournamentPhase.KNOCKOUT
+        else:
+            return self.pair_next_round(tournament_id)
+
+        games = self._insert_rounds(tournament, rounds)
+        self._record_standings(tournament_id, player_ids, rounds)
+        tournament.player_count = len(player_ids)
+        tournament.phase = phase
+        db.session.commit()
+        log.info(
+            f"Tournament {tournament_id}: {len(rounds)} rounds, {games} games scheduled"
+        )
+        return {"tournament_id": tournament_id, "rounds": len(rounds), "games": games}
+
+    def pair_next_round(self, tournament_id):
+        """
+        Pair and insert the next round of a Swiss tournament once every game
+        of the current round is finished.
+        """
+        tournament = self._get_tournament(tournament_id)
+        if tournament.tournament_type != TournamentType.SWISS:
+            abort(400, message="Only Swiss tournaments are paired round by round")
+        if self._has_open_games(tournament_id):
+            abort(409, message="Current round is not finished")
+
+        ratings = dict(
+            db.session.query(TournamentParticipant.player_id, Player.score)
+            .join(Player, Player.id == TournamentParticipant.player_id)
+            .filter(TournamentParticipant.tournament_id == tournament_id)
+        )
+        if len(ratings) < 2:
+            abort(400, message="Tournament needs at least two participants")
+        standings = SwissStandings(
+            ratings,
+            db.session.query(
+                Game.round_number, Game.player1_id, Game.player2_id, Game.winner_id
+            ).filter(Game.tournament_id == tournament_id),
+        )
+        pairs, bye = swiss_pairings(
+            standings.ranked(ratings),
+            standings.points,
+            standings.opponents,
+            standings.byes,
+        )
+
+        games = [(player1, player2, None) for player1, player2 in pairs]
+        if bye is not None:
+            games.append((bye, None, bye))
+        round_number = standings.rounds + 1
+        self._insert_rounds(tournament, [games], first_round=round_number)
+        self._record_standings(tournament_id, ratings, [games])
+        tournament.player_count = len(ratings)
+        tournament.phase = TournamentPhase.GROUP_STAGE
+        db.session.commit()
+        log.info(f"Tournament {tournament_id}: Swiss round {round_number} paired")
+        return {
+            "tournament_id": tournament_id,
+            "rounds": round_number,
+            "games": len(games),
+        }
+
+    def record_result(self, tournament_id, game_id, winner_id):
+        tournament = self._get_tournament(tournament_id)
+        game = db.session.get(Game, game_id)
+        if game is None or game.tournament_id != tournament_id:
+            abort(404, message="Game not found in tournament")
+        if game.status == GameStatus.COMPLETED:
+            abort(409, message="Game already finished")
+        if game.player1_id is None or game.player2_id is None:
+            abort(409, message="Game players are not known yet")
+        if winner_id not in (game.player1_id, game.player2_id):
+            abort(400, message="Winner must be one of the game players")
+
+        game.winner_id = winner_id
+        game.status = GameStatus.COMPLETED
+        if tournament.tournament_type == TournamentType.ELIMINATION:
+            self._advance_winner(game)
+        StandingsService().record_game(game)
+        # A Swiss tournament has no fixed end; its next round is paired on demand
+        if (
+            tournament.tournament_type != TournamentType.SWISS
+            and not self._has_open_games(tournament_id)
+        ):
+            tournament.phase = TournamentPhase.COMPLETED
+        db.session.commit()
+        return get_schema(GameSchema, session=db.session).dump(game)
+
+    def _get_tournament(self, tournament_id):
+        tournament = db.session.get(Tournament, tournament_id)
+        if tournament is None:
+            abort(404, message="Tournament not found")
+        return tournament
+
+    def _seeded_player_ids(self, tournament_id):
+        rows = (
+            db.session.query(TournamentParticipant.player_id)
+            .join(Player, Player.id == TournamentParticipant.player_id)
+            .filter(TournamentParticipant.tournament_id == tournament_id)
+            .order_by(Player.score.desc(), Player.id.asc())
+            .all()
+        )
+        return [player_id for (player_id,) in rows]
+
+    def _insert_rounds(self, tournament, rounds, first_round=1):
+        tournament_id, season_id = tournament.id, tournament.season_id
+        # Rows go to the driver as is, so the enum is bound as stored
+        open_status, done_status = (
+            GameStatus.IN_PROGRESS.name,
+            GameStatus.COMPLETED.name,
+        )
+        rows = [
+            (
+                season_id,
+                tournament_id,
+                number,
+                position,
+                player1,
+                0,
+                player2,
+                0,
+                winner,
+                open_status if winner is None else done_status,
+            )
+            for number, games in enumerate(rounds, start=first_round)
+            for position, (player1, player2, winner) in enumerate(games)
+        ]
+        # A plain executemany processes parameters row by row, which dominates
+        # for the ~130k games of a 512 player round robin, so rows are sent in
+        # multi-row VALUES chunks.
+        connection = db.session.connection()
+        for start in range(0, len(rows), INSERT_BATCH):
+            chunk = rows[start : start + INSERT_BATCH]
+            sql, positional = _multi_row_insert(connection.dialect, len(chunk))
+            if positional:
+                parameters = tuple(chain.from_iterable(chunk))
+            else:
+                parameters = {
+                    f"{column}_{i}": value
+                    for i, row in enumerate(chunk)
+                    for column, value in zip(GAME_COLUMNS, row)
+                }
+            connection.exec_driver_sql(sql, parameters)
+        return len(rows)
+
+    def _record_standings(self, tournament_id, player_ids, rounds):
+        """Create standings rows and credit the byes of freshly inserted rounds."""
+        standings = StandingsService()
+        standings.initialize(tournament_id, player_ids)
+        for games in rounds:
+            for player1, player2, winner in games:
+                if player2 is None and winner is not None:
+                    standings.record_bye(tournament_id, winner)
+
+    def _advance_winner(self, game):
+        next_game = Game.query.filter_by(
+            tournament_id=game.tournament_id,
+            round_number=game.round_number + 1,
+            bracket_position=game.bracket_position // 2,
+        ).one_or_none()
+        if next_game is None:
+            return  # the final
+
+        if game.bracket_position % 2 == 0:
+            next_game.player1_id = game.winner_id
+        else:
+            next_game.player2_id = game.winner_id
+
+    def _has_open_games(self, tournament_id):
+        return db.session.query(
+            Game.query.filter(
+                Game.tournament_id == tournament_id,
+                Game.status == GameStatus.IN_PROGRESS,
+            ).exists()
+        ).scalar()
@@ -1,6 +1,26 @@
 from functools import wraps
-from flask import jsonify, make_response, Response
-from werkzeug.wrappers import Response as WerkzeugResponse
+from flask import jsonify, make_response
+
+
+STATUS_MESSAGES = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    500: "Internal Server Error",
+    700: "Wrong match in query",
+}
+
+
+def make_envelope(data, status_code=200):
+    """Build the ``{"status", "state", "data"}`` body every API view returns."""
+    return {
+        "status": status_code,
+        "state": STATUS_MESSAGES.get(status_code, "Unknown Status"),
+        "data": data,
+    }
 
 
 def format_response(func):
@@ -8,35 +28,18 @@ def format_response(func):
     def decorated_function(*args, **kwargs):
         response = func(*args, **kwargs)
 
-        if isinstance(response, tuple):
+        headers = None
+        if isinstance(response, tuple) and len(response) == 3:
+            data, status_code, headers = response
+        elif isinstance(response, tuple):
             data, status_code = response
         else:
             data = response
             status_code = 200  # Default status code
 
-        # If the response is an instance of Response or WerkzeugResponse, extract the JSON data
-        if isinstance(data, (Response, WerkzeugResponse)):
-            data = data.get_json()
-
-        status_messages = {
-            200: "OK",
-            201: "Created",
-            400: "Bad Request",
-            401: "Unauthorized",
-            403: "Forbidden",
-            404: "Not Found",
-            500: "Internal Server Error",
-            700: "Wrong match in query",
-        }
-
-        status_message = status_messages.get(status_code, "Unknown Status")
-
-        formatted_response = {
-            "status": status_code,
-            "state": status_message,
-            "data": data,
-        }
-
-        return make_response(jsonify(formatted_response), status_code)
+        # The envelope is serialized exactly once, by the app's JSON provider
+        return make_response(
+            jsonify(make_envelope(data, status_code)), status_code, headers
+        )
 
     return decorated_function
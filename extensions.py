@@ -1,5 +1,38 @@
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 
 db = SQLAlchemy()
 migrate = Migrate()
+
+SQLITE_PRAGMAS = {
+    "journal_mode": "SQLITE_JOURNAL_MODE",
+    "synchronous": "SQLITE_SYNCHRONOUS",
+    "busy_timeout": "SQLITE_BUSY_TIMEOUT",
+    "mmap_size": "SQLITE_MMAP_SIZE",
+    "cache_size": "SQLITE_CACHE_SIZE",
+    "temp_store": "SQLITE_TEMP_STORE",
+}
+
+
+def apply_sqlite_pragmas(engine, config):
+    """
+    Run the configured ``PRAGMA`` statements on every new SQLite connection.
+
+    :param engine: SQLAlchemy engine to tune, non-SQLite engines are ignored
+    :param config: mapping with the ``SQLITE_*`` settings from ``Config``
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = [
+        (pragma, config.get(key))
+        for pragma, key in SQLITE_PRAGMAS.items()
+        if config.get(key) is not None
+    ]
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas:
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
@@ -0,0 +1,60 @@
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson.
+
+    Dates, decimals, UUIDs and dataclasses are still passed to Flask's
+    ``default`` hook, so responses look the same as with the stock provider.
+    """
+
+    def _options(self):
+        options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        options = self._options()
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            options |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=options) + b"\n",
+            mimetype=self.mimetype,
+        )
+
+
+JSON_PROVIDERS = {"default": DefaultJSONProvider, "orjson": OrjsonProvider}
+
+
+def init_json_provider(app):
+    """
+    Register the JSON provider selected by ``JSON_PROVIDER``.
+
+    ``auto`` picks orjson when it is installed and falls back to Flask's
+    provider otherwise.
+    """
+    name = app.config.get("JSON_PROVIDER", "auto")
+    if name == "auto":
+        name = "orjson" if orjson is not None else "default"
+    if name == "orjson" and orjson is None:
+        raise RuntimeError("JSON_PROVIDER is 'orjson' but orjson is not installed")
+    app.json = JSON_PROVIDERS[name](app)
+    return app.json
@@ -0,0 +1,51 @@
+"""Match state snapshots
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 09:12:40.118203
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.versions import log
+
+
+# revision identifiers, used by Alembic.
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    try:
+        log.info(f"{revision} - Creating table 'match_state_snapshots'...")
+        op.create_table(
+            "match_state_snapshots",
+            sa.Column("match_id", sa.Integer(), nullable=False),
+            sa.Column("last_event_id", sa.Integer(), nullable=False),
+            sa.Column("state", sa.JSON(), nullable=False),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(),
+                server_default=sa.text("(CURRENT_TIMESTAMP)"),
+                nullable=True,
+            ),
+            sa.ForeignKeyConstraint(
+                ["match_id"],
+                ["matches.id"],
+                ondelete="CASCADE",
+                name="fk_matches_id_match_state_snapshots",
+            ),
+            sa.PrimaryKeyConstraint("match_id", name="pk_match_state_snapshots"),
+        )
+    except Exception as e:
+        log.error(
+            f"{revision} - Error creating table 'match_state_snapshots'. message: {e}"
+        )
+
+
+def downgrade():
+    op.drop_table("match_state_snapshots")
@@ -0,0 +1,41 @@
+"""Indexes for event, match and game hot queries
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 10:02:11.530771
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.versions import log
+
+
+# revision identifiers, used by Alembic.
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_events_match_id_timestamp", "events", ["match_id", "timestamp"]),
+    ("ix_matches_game_id_status", "matches", ["game_id", "status"]),
+    ("ix_games_season_id_status", "games", ["season_id", "status"]),
+    ("ix_hit_ball_event_data_event_id", "hit_ball_event_data", ["event_id"]),
+    ("ix_ball_potted_event_data_event_id", "ball_potted_event_data", ["event_id"]),
+    ("ix_foul_event_data_event_id", "foul_event_data", ["event_id"]),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        try:
+            log.info(f"{revision} - Creating index '{name}' on '{table}'...")
+            op.create_index(name, table, columns, unique=False)
+        except Exception as e:
+            log.error(f"{revision} - Error creating index '{name}'. message: {e}")
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
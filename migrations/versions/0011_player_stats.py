@@ -0,0 +1,56 @@
+"""Materialized player statistics
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 13:25:07.441096
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.versions import log
+
+
+# revision identifiers, used by Alembic.
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    try:
+        log.info(f"{revision} - Creating table 'player_stats'...")
+        op.create_table(
+            "player_stats",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("scope_type", sa.String(length=16), nullable=False),
+            sa.Column("scope_id", sa.Integer(), nullable=False),
+            sa.Column("player_id", sa.Integer(), nullable=False),
+            sa.Column("played", sa.Integer(), nullable=False),
+            sa.Column("wins", sa.Integer(), nullable=False),
+            sa.Column("losses", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["player_id"], ["players.id"], name="fk_players_id_player_stats"
+            ),
+            sa.PrimaryKeyConstraint("id", name="pk_player_stats"),
+            sa.UniqueConstraint(
+                "scope_type",
+                "scope_id",
+                "player_id",
+                name="uq_player_stats_scope_player",
+            ),
+        )
+        op.create_index(
+            "ix_player_stats_leaderboard",
+            "player_stats",
+            ["scope_type", "scope_id", sa.text("wins DESC"), "player_id"],
+            unique=False,
+        )
+    except Exception as e:
+        log.error(f"{revision} - Error creating table 'player_stats'. message: {e}")
+
+
+def downgrade():
+    op.drop_index("ix_player_stats_leaderboard", table_name="player_stats")
+    op.drop_table("player_stats")
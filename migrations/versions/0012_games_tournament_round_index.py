@@ -0,0 +1,37 @@
+"""Index games by tournament round
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 14:10:42.907315
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.versions import log
+
+
+# revision identifiers, used by Alembic.
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    try:
+        log.info(f"{revision} - Creating index 'ix_games_tournament_id_round_number'...")
+        op.create_index(
+            "ix_games_tournament_id_round_number",
+            "games",
+            ["tournament_id", "round_number"],
+            unique=False,
+        )
+    except Exception as e:
+        log.error(
+            f"{revision} - Error creating index 'ix_games_tournament_id_round_number'. message: {e}"
+        )
+
+
+def downgrade():
+    op.drop_index("ix_games_tournament_id_round_number", table_name="games")
@@ -0,0 +1,55 @@
+"""Cached tournament standings
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18 15:02:37.118254
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.versions import log
+
+# revision identifiers, used by Alembic.
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    try:
+        log.info(f"{revision} - Creating table 'tournament_standings'...")
+        op.create_table(
+            "tournament_standings",
+            sa.Column("tournament_id", sa.Integer(), nullable=False),
+            sa.Column("player_id", sa.Integer(), nullable=False),
+            sa.Column("played", sa.Integer(), nullable=False),
+            sa.Column("wins", sa.Integer(), nullable=False),
+            sa.Column("losses", sa.Integer(), nullable=False),
+            sa.Column("byes", sa.Integer(), nullable=False),
+            sa.Column("points", sa.Integer(), nullable=False),
+            sa.Column("buchholz", sa.Integer(), nullable=False),
+            sa.Column("sonneborn_berger", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["player_id"],
+                ["players.id"],
+                name="fk_tournament_standings_player_id",
+            ),
+            sa.ForeignKeyConstraint(
+                ["tournament_id"],
+                ["tournaments.id"],
+                name="fk_tournament_standings_tournament_id",
+            ),
+            sa.PrimaryKeyConstraint(
+                "tournament_id", "player_id", name="pk_tournament_standings"
+            ),
+        )
+    except Exception as e:
+        log.error(
+            f"{revision} - Error creating table 'tournament_standings'. message: {e}"
+        )
+
+
+def downgrade():
+    op.drop_table("tournament_standings")
@@ -0,0 +1,36 @@
+"""Scheduler job leases
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-18 15:48:03.562810
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.versions import log
+
+
+# revision identifiers, used by Alembic.
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    try:
+        log.info(f"{revision} - Creating table 'scheduler_leases'...")
+        op.create_table(
+            "scheduler_leases",
+            sa.Column("name", sa.String(length=64), nullable=False),
+            sa.Column("owner", sa.String(length=128), nullable=False),
+            sa.Column("expires_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("name", name="pk_scheduler_leases"),
+        )
+    except Exception as e:
+        log.error(f"{revision} - Error creating table 'scheduler_leases'. message: {e}")
+
+
+def downgrade():
+    op.drop_table("scheduler_leases")
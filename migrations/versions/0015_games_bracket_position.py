@@ -0,0 +1,36 @@
+"""Bracket position of tournament games
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-18 18:12:40.218734
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.versions import log
+
+
+# revision identifiers, used by Alembic.
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    try:
+        log.info(f"{revision} - Adding column 'bracket_position' to 'games'...")
+        with op.batch_alter_table("games", schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column("bracket_position", sa.Integer(), nullable=True)
+            )
+    except Exception as e:
+        log.error(
+            f"{revision} - Error adding column 'bracket_position' to 'games'. message: {e}"
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("games", schema=None) as batch_op:
+        batch_op.drop_column("bracket_position")
@@ -0,0 +1,38 @@
+"""Rated matches of players
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-18 18:41:09.573126
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.versions import log
+
+
+# revision identifiers, used by Alembic.
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    try:
+        log.info(f"{revision} - Adding column 'rated_matches' to 'players'...")
+        with op.batch_alter_table("players", schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column(
+                    "rated_matches", sa.Integer(), nullable=False, server_default="0"
+                )
+            )
+    except Exception as e:
+        log.error(
+            f"{revision} - Error adding column 'rated_matches' to 'players'. message: {e}"
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("players", schema=None) as batch_op:
+        batch_op.drop_column("rated_matches")
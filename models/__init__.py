@@ -1,29 +1,34 @@
 from .game import Game, GameStatus
 from .events import EventType, Event
 from .club import Club
-from .match import Match
+from .match import Match, MatchStateSnapshot
 from .season import Season
 from .tounament import (
     TournamentType,
     TournamentPhase,
     TournamentParticipant,
+    TournamentStanding,
     Tournament,
 )
-from .player import Player
+from .player import Player, PlayerStats
 from .news import News, Tag, news_tags
-from .common import WinReason
+from .common import SchedulerLease, WinReason
 
 __all__ = [
     "Game",
     "Event",
     "Club",
     "Match",
+    "MatchStateSnapshot",
     "Season",
     "Tournament",
     "TournamentParticipant",
+    "TournamentStanding",
     "Player",
+    "PlayerStats",
     "News",
     "Tag",
     "news_tags",
+    "SchedulerLease",
     "WinReason",
 ]
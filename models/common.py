@@ -5,3 +5,17 @@ class WinReason(db.Model):
     __tablename__ = "win_reason"
     id = db.Column(db.Integer, primary_key=True)
     description = db.Column(db.String(255), nullable=False)
+
+
+class SchedulerLease(db.Model):
+    """
+    Time-limited claim of a periodic job by one process.
+
+    Every process that runs the scheduler tries to take the lease before a
+    job; only the owner of an unexpired lease runs it.
+    """
+
+    __tablename__ = "scheduler_leases"
+    name = db.Column(db.String(64), primary_key=True)
+    owner = db.Column(db.String(128), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
@@ -13,6 +13,9 @@ class EventType(PyEnum):
 
 class Event(db.Model):
     __tablename__ = "events"
+    __table_args__ = (
+        db.Index("ix_events_match_id_timestamp", "match_id", "timestamp"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     match_id = db.Column(
@@ -35,7 +38,10 @@ class HitBallEventData(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(
-        db.Integer, db.ForeignKey("events.id", ondelete="CASCADE"), nullable=False
+        db.Integer,
+        db.ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     ball_number = db.Column(db.Integer, nullable=False)
     event = db.relationship("Event", backref="hit_ball_data")
@@ -46,7 +52,10 @@ class BallPottedEventData(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(
-        db.Integer, db.ForeignKey("events.id", ondelete="CASCADE"), nullable=False
+        db.Integer,
+        db.ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     ball_number = db.Column(db.Integer, nullable=False)
     pocket_id = db.Column(db.Integer, nullable=False)  # Идентификатор лузы
@@ -59,7 +68,10 @@ class FoulEventData(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(
-        db.Integer, db.ForeignKey("events.id", ondelete="CASCADE"), nullable=False
+        db.Integer,
+        db.ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     reason = db.Column(db.String(255), nullable=False)
 
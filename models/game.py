@@ -10,6 +10,10 @@ class GameStatus(PyEnum):
 
 class Game(db.Model):
     __tablename__ = "games"
+    __table_args__ = (
+        db.Index("ix_games_season_id_status", "season_id", "status"),
+        db.Index("ix_games_tournament_id_round_number", "tournament_id", "round_number"),
+    )
     id = db.Column(db.Integer, primary_key=True)
     club_id = db.Column(db.Integer, db.ForeignKey("clubs.id"), nullable=True)
     season_id = db.Column(db.Integer, db.ForeignKey("season.id"))
@@ -17,6 +21,9 @@ class Game(db.Model):
         db.Integer, db.ForeignKey("tournaments.id"), nullable=True
     )
     round_number = db.Column(db.Integer, nullable=True)
+    # Index of the game within its tournament round; the winner of position
+    # ``n`` plays the next round at position ``n // 2``
+    bracket_position = db.Column(db.Integer, nullable=True)
     player1_id = db.Column(db.Integer, db.ForeignKey("players.id"))
     player1_score = db.Column(db.Integer, default=0, nullable=True)
     player2_id = db.Column(db.Integer, db.ForeignKey("players.id"))
@@ -11,6 +11,7 @@ class MatchStatus(PyEnum):
 
 class Match(db.Model):
     __tablename__ = "matches"
+    __table_args__ = (db.Index("ix_matches_game_id_status", "game_id", "status"),)
 
     id = db.Column(db.Integer, primary_key=True)
     player1_id = db.Column(db.Integer, db.ForeignKey("players.id"))
@@ -30,3 +31,32 @@ class Match(db.Model):
     )
     winner = db.relationship("Player", foreign_keys=[winner_id])
     game = db.relationship("Game", back_populates="matches")
+    state_snapshot = db.relationship(
+        "MatchStateSnapshot", back_populates="match", uselist=False
+    )
+
+
+class MatchStateSnapshot(db.Model):
+    """
+    Match state folded over every event up to ``last_event_id``.
+
+    The row is rewritten in the same transaction as each new event, so
+    ``MatchEventService`` only has to replay events newer than the snapshot.
+    ``version`` is managed by SQLAlchemy and guards against concurrent writers.
+    """
+
+    __tablename__ = "match_state_snapshots"
+
+    match_id = db.Column(
+        db.Integer, db.ForeignKey("matches.id", ondelete="CASCADE"), primary_key=True
+    )
+    last_event_id = db.Column(db.Integer, nullable=False)
+    state = db.Column(db.JSON, nullable=False)
+    version = db.Column(db.Integer, nullable=False)
+    updated_at = db.Column(
+        db.DateTime, server_default=db.func.now(), onupdate=db.func.now()
+    )
+
+    match = db.relationship("Match", back_populates="state_snapshot")
+
+    __mapper_args__ = {"version_id_col": version}
@@ -8,6 +8,8 @@ class Player(db.Model):
     name = db.Column(db.String, nullable=False)
     score = db.Column(db.Integer, default=0)
     played_games = db.Column(db.Integer, default=0)
+    # Matches counted in the Elo rating ``score``
+    rated_matches = db.Column(db.Integer, nullable=False, default=0, server_default="0")
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"))
     wins = db.Column(db.Integer, default=0)
     losses = db.Column(db.Integer, default=0)
@@ -23,3 +25,37 @@ class Player(db.Model):
         "Match", foreign_keys="Match.player2_id", back_populates="player2_relation"
     )
     events = db.relationship("Event", back_populates="player", overlaps="event_records")
+
+
+class PlayerStats(db.Model):
+    """
+    Materialized per-season and per-club results of a player.
+
+    One row per (scope_type, scope_id, player_id), where ``scope_type`` is
+    ``"season"`` or ``"club"``. Rows are updated in the same transaction that
+    completes a match and can be rebuilt from match history.
+    """
+
+    __tablename__ = "player_stats"
+    __table_args__ = (
+        db.UniqueConstraint(
+            "scope_type", "scope_id", "player_id", name="uq_player_stats_scope_player"
+        ),
+        db.Index(
+            "ix_player_stats_leaderboard",
+            "scope_type",
+            "scope_id",
+            db.desc("wins"),
+            "player_id",
+        ),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    scope_type = db.Column(db.String(16), nullable=False)
+    scope_id = db.Column(db.Integer, nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey("players.id"), nullable=False)
+    played = db.Column(db.Integer, nullable=False, default=0)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    losses = db.Column(db.Integer, nullable=False, default=0)
+
+    player = db.relationship("Player")
@@ -53,3 +53,30 @@ class Tournament(db.Model):
     updated_at = db.Column(
         db.DateTime, server_default=db.func.now(), onupdate=db.func.now()
     )
+
+
+class TournamentStanding(db.Model):
+    """
+    Cached standings row of one tournament participant.
+
+    ``buchholz`` is the sum of the current points of every opponent and
+    ``sonneborn_berger`` the sum of the points of every defeated opponent.
+    Rows are updated incrementally as tournament games finish and can be
+    recomputed from the games.
+    """
+
+    __tablename__ = "tournament_standings"
+
+    tournament_id = db.Column(
+        db.Integer, db.ForeignKey("tournaments.id"), primary_key=True
+    )
+    player_id = db.Column(db.Integer, db.ForeignKey("players.id"), primary_key=True)
+    played = db.Column(db.Integer, nullable=False, default=0)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    losses = db.Column(db.Integer, nullable=False, default=0)
+    byes = db.Column(db.Integer, nullable=False, default=0)
+    points = db.Column(db.Integer, nullable=False, default=0)
+    buchholz = db.Column(db.Integer, nullable=False, default=0)
+    sonneborn_berger = db.Column(db.Integer, nullable=False, default=0)
+
+    player = db.relationship("Player")
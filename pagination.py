@@ -0,0 +1,68 @@
+import marshmallow as ma
+from flask_smorest import abort
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from webargs.fields import DelimitedList
+
+from schemas.registry import get_schema
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PaginationArgsSchema(ma.Schema):
+    """
+    Query arguments shared by every list view.
+
+    ``limit`` caps the page size, ``after`` is the cursor returned in the
+    ``X-Next-Cursor`` header of the previous page and ``fields`` is a comma
+    separated list of fields to return.
+    """
+
+    class Meta:
+        unknown = ma.EXCLUDE
+
+    limit = ma.fields.Integer(
+        load_default=DEFAULT_LIMIT, validate=ma.validate.Range(min=1, max=MAX_LIMIT)
+    )
+    after = ma.fields.Integer(load_default=None)
+    fields = DelimitedList(ma.fields.String())
+
+
+def paginate(query, model, schema_cls, args, **schema_kwargs):
+    """
+    Keyset-paginate ``query`` on the model's primary key and dump one page.
+
+    Only the requested ``fields`` are selected from the database and
+    serialized. The primary key is always loaded because it is the cursor.
+
+    :param query: SQLAlchemy query over ``model``
+    :param model: mapped class with an ``id`` primary key
+    :param schema_cls: marshmallow schema used to dump the page
+    :param args: arguments loaded with :class:`PaginationArgsSchema`
+    :return: ``(data, status_code, headers)`` tuple for ``format_response``
+    """
+    fields = args.get("fields")
+    try:
+        schema = get_schema(schema_cls, many=True, only=fields, **schema_kwargs)
+    except ValueError as e:
+        abort(400, message=str(e))
+
+    if fields:
+        columns = {attr.key for attr in inspect(model).column_attrs}
+        query = query.options(
+            load_only(
+                *(getattr(model, name) for name in set(fields) & columns),
+                model.id,
+            )
+        )
+    if args["after"] is not None:
+        query = query.filter(model.id > args["after"])
+
+    items = query.order_by(model.id.asc()).limit(args["limit"] + 1).all()
+    headers = {}
+    if len(items) > args["limit"]:
+        items = items[: args["limit"]]
+        headers[NEXT_CURSOR_HEADER] = str(items[-1].id)
+    return schema.dump(items), 200, headers
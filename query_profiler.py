@@ -0,0 +1,139 @@
+import heapq
+from contextvars import ContextVar
+from time import perf_counter_ns
+
+from flask import g, request
+from sqlalchemy import event
+
+from extensions import db
+from metrics import (
+    UNMATCHED_ROUTE,
+    db_queries_per_request,
+    db_query_budget_exceeded,
+    db_query_time_per_request,
+)
+from utils import log
+
+# Longest statement text kept for logs and debug headers
+MAX_STATEMENT_LENGTH = 200
+
+# Profile of the request being served in the current context, if any
+_current = ContextVar("query_profile", default=None)
+
+
+def _shorten(statement):
+    statement = " ".join(statement.split())
+    if len(statement) > MAX_STATEMENT_LENGTH:
+        return statement[: MAX_STATEMENT_LENGTH - 3] + "..."
+    return statement
+
+
+class QueryProfile:
+    """Query count, total SQL time and the slowest statements of one request."""
+
+    def __init__(self, keep):
+        self.count = 0
+        self.total_ns = 0
+        self.keep = keep
+        self._slowest = []  # min-heap of (duration_ns, statement)
+
+    def add(self, statement, duration_ns):
+        self.count += 1
+        self.total_ns += duration_ns
+        if len(self._slowest) < self.keep:
+            heapq.heappush(self._slowest, (duration_ns, statement))
+        elif duration_ns > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, (duration_ns, statement))
+
+    @property
+    def total_ms(self):
+        return self.total_ns / 1e6
+
+    def slowest(self):
+        """``[(duration_ms, statement), ...]``, slowest first."""
+        return [
+            (duration_ns / 1e6, _shorten(statement))
+            for duration_ns, statement in sorted(self._slowest, reverse=True)
+        ]
+
+
+def profile_engine(engine, slow_query_ms):
+    """
+    Time every statement ``engine`` runs, add it to the profile of the
+    current request and log it if it takes ``slow_query_ms`` or longer.
+    """
+    slow_ns = None if slow_query_ms is None else slow_query_ms * 1_000_000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_query(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(perf_counter_ns())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finish_query(conn, cursor, statement, parameters, context, executemany):
+        duration_ns = perf_counter_ns() - conn.info["query_started"].pop()
+        profile = _current.get()
+        if profile is not None:
+            profile.add(statement, duration_ns)
+        if slow_ns is not None and duration_ns >= slow_ns:
+            log.warning(
+                f"Slow query ({duration_ns / 1e6:.1f} ms): {_shorten(statement)}"
+            )
+
+
+def init_app(app):
+    """
+    Profile the SQL of every request when ``QUERY_PROFILER`` is on.
+
+    Per request, query count and SQL time are recorded as metrics labelled
+    by route and, in debug mode, returned in ``X-Query-*`` response headers.
+    Requests running more queries than their budget (``QUERY_BUDGETS`` by
+    endpoint, else ``QUERY_BUDGET``) are logged and counted.
+    """
+    if not app.config["QUERY_PROFILER"]:
+        return
+    keep = app.config["QUERY_PROFILER_SLOWEST"]
+    default_budget = app.config["QUERY_BUDGET"]
+    budgets = app.config["QUERY_BUDGETS"]
+
+    with app.app_context():
+        for engine in db.engines.values():
+            profile_engine(engine, app.config["SLOW_QUERY_MS"])
+
+    @app.before_request
+    def _start_profile():
+        g.query_profile_token = _current.set(QueryProfile(keep))
+
+    @app.after_request
+    def _report_profile(response):
+        profile = _current.get()
+        if profile is None:
+            return response
+
+        rule = request.url_rule
+        attributes = {"http.route": rule.rule if rule is not None else UNMATCHED_ROUTE}
+        db_queries_per_request.record(profile.count, attributes)
+        db_query_time_per_request.record(profile.total_ms, attributes)
+
+        budget = budgets.get(request.endpoint, default_budget)
+        if budget is not None and profile.count > budget:
+            db_query_budget_exceeded.add(1, attributes)
+            log.warning(
+                f"Query budget exceeded by {request.method} {request.path} "
+                f"({request.endpoint}): {profile.count} queries, budget {budget}, "
+                f"{profile.total_ms:.1f} ms"
+            )
+
+        if app.debug:
+            response.headers["X-Query-Count"] = str(profile.count)
+            response.headers["X-Query-Time-Ms"] = f"{profile.total_ms:.2f}"
+            for duration_ms, statement in profile.slowest():
+                response.headers.add("X-Query-Slowest", f"{duration_ms:.2f}ms {statement}")
+        return response
+
+    @app.teardown_request
+    def _end_profile(exc):
+        token = g.pop("query_profile_token", None)
+        if token is not None:
+            _current.reset(token)
+
+    log.info("SQL query profiler enabled.")
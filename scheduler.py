@@ -1,84 +1,199 @@
+import os
+import socket
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
 from flask import Flask
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
 
 from utils import log
-from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.blocking import BlockingScheduler
 from extensions import db
+from metrics import init_telemetry, season_rollover_duration, season_rollover_games
+from models.common import SchedulerLease
 from models.season import Season
-from models.game import Game
+from models.game import Game, GameStatus
 
 
-def get_current_season_dates():
-    now = datetime.now()
-    year = now.year
+def get_current_season_dates(today=None):
+    today = today or datetime.now().date()
+    year = today.year
 
-    if now.month in [3, 4, 5]:
-        start_date = datetime(year, 3, 1)
-        end_date = datetime(year, 5, 31)
+    if today.month in [3, 4, 5]:
+        start_date = date(year, 3, 1)
+        end_date = date(year, 5, 31)
         season_name = f"Spring {year}"
-    elif now.month in [6, 7, 8]:
-        start_date = datetime(year, 6, 1)
-        end_date = datetime(year, 8, 31)
+    elif today.month in [6, 7, 8]:
+        start_date = date(year, 6, 1)
+        end_date = date(year, 8, 31)
         season_name = f"Summer {year}"
-    elif now.month in [9, 10, 11]:
-        start_date = datetime(year, 9, 1)
-        end_date = datetime(year, 11, 30)
+    elif today.month in [9, 10, 11]:
+        start_date = date(year, 9, 1)
+        end_date = date(year, 11, 30)
         season_name = f"Autumn {year}"
     else:  # Зима
-        start_date = datetime(year, 12, 1)
-        end_date = (
-            datetime(year + 1, 2, 28) if year % 4 != 0 else datetime(year + 1, 2, 29)
-        )
+        if today.month in [1, 2]:
+            year -= 1
+        start_date = date(year, 12, 1)
+        end_date = date(year + 1, 3, 1) - timedelta(days=1)
         season_name = f"Winter {year}-{year + 1}"
 
     log.info(f"{season_name} started from {start_date} till {end_date} is selected.")
     return season_name, start_date, end_date
 
 
-def check_season(app: Flask):
+def rollover_season(today=None):
+    """
+    Close the active season once it has ended, open the season ``today``
+    falls in and move every unfinished game to it.
+
+    Runs as one transaction with a single set-based ``UPDATE`` of the games.
+    Running it again finds the new season active and changes nothing.
+
+    :return: ``(active_season, moved_games)``
+    """
+    today = today or datetime.now().date()
+    current_season = (
+        Season.query.filter_by(is_active=True).order_by(Season.end_date.desc()).first()
+    )
+    if current_season is not None and today <= current_season.end_date:
+        log.info(f"Current season is active! {current_season.name}")
+        return current_season, 0
+
+    started = time.perf_counter()
+    season_name, start_date, end_date = get_current_season_dates(today)
+    new_season = Season.query.filter_by(name=season_name).first()
+    if new_season is None:
+        new_season = Season(start_date=start_date, end_date=end_date, name=season_name)
+        db.session.add(new_season)
+    new_season.is_active = True
+    db.session.flush()
+
+    moved_games = 0
+    if current_season is not None:
+        current_season.is_active = False
+        moved_games = db.session.execute(
+            update(Game)
+            .where(
+                Game.season_id == current_season.id,
+                or_(Game.status != GameStatus.COMPLETED, Game.status.is_(None)),
+            )
+            .values(season_id=new_season.id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+    db.session.commit()
+
+    season_rollover_duration.record((time.perf_counter() - started) * 1000)
+    season_rollover_games.add(moved_games)
+    log.info(f"New season - {season_name} - started! {moved_games} games moved.")
+    return new_season, moved_games
+
+
+class JobLease:
+    """
+    Database lease that lets exactly one process run a periodic job.
+
+    Every scheduler process calls :meth:`acquire` before running the job.
+    Taking the lease is a single conditional ``UPDATE`` (or the first
+    ``INSERT``), so when all workers wake up at the same second only one of
+    them wins; the others see an unexpired lease held by someone else and
+    skip the run. The lease is kept until it expires, so a process that
+    wakes up late does not run the job a second time.
+    """
+
+    def __init__(self, name, ttl, owner=None):
+        self.name = name
+        self.ttl = ttl
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+    def acquire(self):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        expires_at = now + timedelta(seconds=self.ttl)
+        taken = db.session.execute(
+            update(SchedulerLease)
+            .where(
+                SchedulerLease.name == self.name,
+                or_(
+                    SchedulerLease.owner == self.owner,
+                    SchedulerLease.expires_at < now,
+                ),
+            )
+            .values(owner=self.owner, expires_at=expires_at)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not taken:
+            db.session.add(
+                SchedulerLease(name=self.name, owner=self.owner, expires_at=expires_at)
+            )
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return False
+        return True
+
+
+def check_season(app: Flask, lease=None):
     log.info("Start job 'check_season'...")
 
     with app.app_context():
-        current_season = Season.query.filter_by(is_active=True).first()
-        today = datetime.now().date()
-
-        if not current_season or today > current_season.end_date:
-            if current_season:
-                current_season.is_active = False
-                db.session.commit()
-
-                season_name, start_date, end_date = get_current_season_dates()
-
-                unfinished_games = Game.query.filter_by(
-                    season_id=current_season.id, is_finished=False
-                ).all()
-                new_season = Season(
-                    start_date=start_date, end_date=end_date, name=season_name
-                )
-                db.session.add(new_season)
-                db.session.commit()
-
-                for game in unfinished_games:
-                    game.season_id = new_season.id
-                    db.session.commit()
-
-            else:
-                season_name, start_date, end_date = get_current_season_dates()
-                new_season = Season(
-                    start_date=start_date, end_date=end_date, name=season_name
-                )
-                db.session.add(new_season)
-                db.session.commit()
-                log.info(f"New season - {season_name} - started!")
-        else:
-            log.info(f"Current season is active! {current_season.to_dict()}")
+        lease = lease or JobLease("check_season", app.config["SCHEDULER_LEASE_TTL"])
+        if not lease.acquire():
+            log.info("Job 'check_season' is run by another process, skipping.")
+            return
+        try:
+            rollover_season()
+        except Exception as e:
+            db.session.rollback()
+            log.error(f"Job 'check_season' failed: {e}")
 
 
-def start_scheduler(app: Flask):
-    scheduler = BackgroundScheduler()
+def add_jobs(scheduler, app: Flask):
     scheduler.add_job(
         check_season, "cron", hour=0, minute=0, second=1, args=[app]
     )
+    return scheduler
+
+
+def start_scheduler(app: Flask):
+    """
+    Start the periodic jobs in a background thread of this process, unless
+    ``SCHEDULER_ENABLED`` is off (e.g. in web workers when a standalone
+    scheduler runs them).
+    """
+    if not app.config["SCHEDULER_ENABLED"]:
+        log.info("Scheduler is disabled by SCHEDULER_ENABLED.")
+        return None
+
+    scheduler = add_jobs(BackgroundScheduler(), app)
     with app.app_context():
         scheduler.start()
         log.info("Scheduler started and job 'check_season' is scheduled.")
+    return scheduler
+
+
+def main():
+    """Standalone scheduler process: ``python -m scheduler``."""
+    from app import create_app
+    from config import ProductionConfig
+
+    class StandaloneSchedulerConfig(ProductionConfig):
+        # This process runs the jobs in the foreground instead
+        SCHEDULER_ENABLED = False
+
+    app = create_app(StandaloneSchedulerConfig)
+    # This process serves no requests, so telemetry is not set up by one
+    init_telemetry(app.config)
+    scheduler = add_jobs(BlockingScheduler(), app)
+    log.info("Standalone scheduler started and job 'check_season' is scheduled.")
+    try:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        log.info("Standalone scheduler stopped.")
+
+
+if __name__ == "__main__":
+    main()
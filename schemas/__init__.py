@@ -1,6 +1,12 @@
-from .tounament import TournamentParticipantSchema, TournamentSchema
+from .tounament import (
+    GameResultSchema,
+    TournamentParticipantSchema,
+    TournamentSchema,
+    TournamentStandingSchema,
+)
 from .player import PlayerSchema
 from .game import GameSchema
 from .tags import TagSchema
 from .news import NewsSchema
 from .season import SeasonSchema
+from .stats import PlayerStatsSchema
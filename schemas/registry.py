@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _build_schema(schema_cls, many, partial, only, kwargs):
+    return schema_cls(many=many, partial=partial, only=only, **dict(kwargs))
+
+
+def get_schema(schema_cls, many=False, partial=False, only=None, **kwargs):
+    """
+    Return a process-wide instance of ``schema_cls`` for this combination of
+    ``many``, ``partial``, ``only`` and constructor keyword arguments.
+
+    Building a marshmallow-sqlalchemy schema is expensive, so each variant is
+    built once and reused. The instances are shared across threads and must
+    not be mutated per request: pass per-call state to ``load``/``dump`` and
+    bind the scoped ``db.session`` at construction, never a plain session.
+    """
+    if only is not None:
+        # ?fields=name,id and ?fields=id,name,id select the same variant
+        only = tuple(sorted(set(only)))
+    return _build_schema(
+        schema_cls, many, partial, only, tuple(sorted(kwargs.items()))
+    )
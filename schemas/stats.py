@@ -0,0 +1,13 @@
+from marshmallow import fields
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
+
+from models import PlayerStats
+
+
+class PlayerStatsSchema(SQLAlchemyAutoSchema):
+    class Meta:
+        model = PlayerStats
+        include_fk = True
+        exclude = ("id", "scope_type", "scope_id")
+
+    player_name = fields.String(attribute="player.name", dump_only=True)
@@ -1,7 +1,7 @@
-from marshmallow import fields
+from marshmallow import Schema, fields
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 
-from models.tounament import TournamentParticipant, Tournament
+from models.tounament import TournamentParticipant, TournamentStanding, Tournament
 from schemas.game import GameSchema
 from schemas.season import SeasonSchema
 from schemas.player import PlayerSchema
@@ -26,3 +26,18 @@ class TournamentSchema(SQLAlchemyAutoSchema):
     games = fields.List(fields.Nested(GameSchema))
     participants = fields.List(fields.Nested(TournamentParticipantSchema))
     season = fields.Nested(SeasonSchema)
+
+
+class GameResultSchema(Schema):
+    winner_id = fields.Integer(required=True)
+
+
+class TournamentStandingSchema(SQLAlchemyAutoSchema):
+    class Meta:
+        model = TournamentStanding
+        include_fk = True
+        exclude = ("tournament_id",)
+
+    rank = fields.Integer(dump_only=True)
+    head_to_head = fields.Integer(dump_only=True)
+    player_name = fields.String(attribute="player.name", dump_only=True)
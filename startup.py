@@ -0,0 +1,66 @@
+import subprocess
+import sys
+from collections import Counter
+from time import perf_counter
+
+# Worker readiness budget the startup report is measured against
+READY_TARGET_MS = 200
+
+
+class StartupProfile:
+    """Wall time of each ``create_app`` step, recorded with :meth:`mark`."""
+
+    def __init__(self):
+        self.started = self._last = perf_counter()
+        self.steps = []
+
+    def mark(self, name):
+        """Close the step that started at the previous mark."""
+        now = perf_counter()
+        self.steps.append((name, now - self._last))
+        self._last = now
+
+    @property
+    def total(self):
+        return self._last - self.started
+
+
+def import_times(module="app"):
+    """
+    Import time of ``module`` in a fresh interpreter, per top-level package.
+
+    Uses ``python -X importtime``, so modules already imported by the
+    current process are still measured.
+
+    :return: ``(total_seconds, [(package, seconds), ...])`` slowest first
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    packages = Counter()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.split(":", 1)[1].split("|")
+        packages[name.strip().split(".")[0]] += int(self_us) / 1e6
+    return sum(packages.values()), packages.most_common()
+
+
+def profile_startup(create_app, config_class, top=12):
+    """Build the ``--profile-startup`` report: imports, then app init steps."""
+    imports_total, packages = import_times()
+    profile = StartupProfile()
+    create_app(config_class, profile=profile)
+
+    lines = [f"Imports (fresh interpreter): {imports_total * 1e3:8.1f} ms"]
+    lines += [f"  {name:<28} {seconds * 1e3:8.1f} ms" for name, seconds in packages[:top]]
+    lines.append(f"create_app({config_class.__name__}): {profile.total * 1e3:8.1f} ms")
+    lines += [f"  {name:<28} {seconds * 1e3:8.1f} ms" for name, seconds in profile.steps]
+    ready_ms = (imports_total + profile.total) * 1e3
+    verdict = "within" if ready_ms <= READY_TARGET_MS else "over"
+    lines.append(
+        f"Ready in {ready_ms:.1f} ms ({verdict} the {READY_TARGET_MS} ms target)"
+    )
+    return "\n".join(lines)
@@ -1,12 +1,17 @@
 import os
 import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
 import pytest
+from sqlalchemy import event
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from config import TestConfig
 from app import create_app
 from extensions import db
+from models import Game, Match, Player, Tournament, TournamentParticipant
 
 
 @pytest.fixture(scope="session")
@@ -26,3 +31,76 @@ def app():
 def client(app):
     """A test client for the app."""
     return app.test_client()
+
+
+@pytest.fixture
+def count_queries(app):
+    """Context manager collecting the SQL statements run inside it."""
+
+    @contextmanager
+    def count():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+    return count
+
+
+@pytest.fixture
+def create_match(app):
+    """Factory of matches between two new players, each in a new game."""
+
+    def create():
+        player1 = Player(name="Match One")
+        player2 = Player(name="Match Two")
+        db.session.add_all([player1, player2])
+        db.session.flush()
+        game = Game(player1_id=player1.id, player2_id=player2.id)
+        db.session.add(game)
+        db.session.flush()
+        match = Match(game_id=game.id, player1_id=player1.id, player2_id=player2.id)
+        db.session.add(match)
+        db.session.commit()
+        return match
+
+    return create
+
+
+@pytest.fixture
+def create_tournament(app):
+    """
+    Factory of tournaments with ``player_count`` registered players, rated
+    from 1000 upwards in creation order.
+
+    :return: ``(tournament, players)``
+    """
+
+    def create(tournament_type, player_count):
+        tournament = Tournament(
+            name="Schedule Cup",
+            tournament_type=tournament_type,
+            organizer="Club",
+            start_date=datetime(2026, 11, 1, tzinfo=timezone.utc),
+            end_date=datetime(2026, 11, 30, tzinfo=timezone.utc),
+        )
+        players = [
+            Player(name=f"Schedule Player {i}", score=1000 + i, played_games=1)
+            for i in range(player_count)
+        ]
+        db.session.add_all([tournament, *players])
+        db.session.flush()
+        db.session.add_all(
+            TournamentParticipant(tournament_id=tournament.id, player_id=player.id)
+            for player in players
+        )
+        db.session.commit()
+        return tournament, players
+
+    return create
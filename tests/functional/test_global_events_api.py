@@ -0,0 +1,59 @@
+from flask import Flask
+
+from models import Event, Match
+from models.events import EventType
+
+from .. import log
+
+
+def test_start_game_and_play_without_loopback_requests(client, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("EventService must not issue loopback requests")
+
+    monkeypatch.setattr(Flask, "test_client", fail)
+
+    game = client.post(
+        "/api/event",
+        json={"event_type": "start_game", "player1_id": 1, "player2_id": 2},
+    )
+    game_json = game.get_json()
+    log.info(game_json)
+    assert game.status_code == 201
+    assert game_json["data"]["description"].endswith("are starting a game...")
+
+    play = client.post("/api/event", json={"event_type": "start_play", "game_id": 1})
+    log.info(play.get_json())
+    assert play.status_code == 201
+
+
+def test_player_scored_records_a_potted_ball(client):
+    game = client.post("/api/game", json={"player1_id": 1, "player2_id": 2})
+    game_id = game.get_json()["data"]["id"]
+    play = client.post(
+        "/api/event", json={"event_type": "start_play", "game_id": game_id}
+    )
+    match = Match.query.filter_by(game_id=game_id).one()
+
+    scored = client.post(
+        "/api/event",
+        json={
+            "event_type": "player_scored",
+            "play_id": match.id,
+            "ball_number": 3,
+            "pocket_id": 2,
+        },
+    )
+
+    assert play.status_code == 201
+    assert scored.status_code == 201
+    [event] = Event.query.filter_by(match_id=match.id).all()
+    assert event.event_type == EventType.BALL_POTTED
+
+
+def test_start_play_of_unknown_game_is_rejected(client):
+    response = client.post(
+        "/api/event", json={"event_type": "start_play", "game_id": 999999}
+    )
+
+    assert response.status_code == 400
+    assert response.get_json()["message"] == "Game not found."
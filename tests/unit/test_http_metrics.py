@@ -0,0 +1,133 @@
+import pytest
+
+import metrics
+from app import create_app
+from config import TestConfig
+from controllers.broadcast import broadcaster
+
+
+class MetricsConfig(TestConfig):
+    RUN_MIGRATIONS = False
+    TELEMETRY_EXPORTER = "prometheus"
+
+
+class FakeHistogram:
+    def __init__(self):
+        self.points = []
+
+    def record(self, value, attributes=None):
+        self.points.append((value, attributes))
+
+
+@pytest.fixture(scope="module")
+def metrics_app(app):
+    return create_app(MetricsConfig)
+
+
+@pytest.fixture
+def client(metrics_app):
+    return metrics_app.test_client()
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    monkeypatch.setattr(metrics, "_telemetry_ready", True)
+    request_metrics = metrics.RequestMetrics()
+    monkeypatch.setattr(metrics, "request_metrics", request_metrics)
+    monkeypatch.setattr(metrics, "response_latency_histogram", FakeHistogram())
+    return request_metrics
+
+
+def _collect(request_metrics):
+    return {
+        tuple(observation.attributes.values()): observation.value
+        for observation in request_metrics.observe_requests(None)
+    }
+
+
+def test_requests_are_labelled_by_route_template(client, recorded):
+    client.get("/api/tournaments/123456/standings")
+    client.get("/api/tournaments/654321/standings")
+
+    route = "/api/tournaments/<int:tournament_id>/standings"
+    assert _collect(recorded) == {(route, "GET", 404): 2}
+    latencies = metrics.response_latency_histogram.points
+    assert len(latencies) == 2
+    assert latencies[0][1] is latencies[1][1]
+    assert all(latency > 0 for latency, _ in latencies)
+
+
+def test_counter_is_cumulative_and_latencies_are_flushed_once(client, recorded):
+    client.get("/api/tournaments/123456/standings")
+    _collect(recorded)
+    client.get("/api/tournaments/123456/standings")
+
+    assert list(_collect(recorded).values()) == [2]
+    assert len(metrics.response_latency_histogram.points) == 2
+
+
+def test_unmatched_paths_share_one_series(client, recorded):
+    client.get("/wp-login.php")
+    client.open("/.env", method="PROPFIND")
+
+    routes = {labels[:2] for labels in _collect(recorded)}
+    assert routes == {
+        (metrics.UNMATCHED_ROUTE, "GET"),
+        (metrics.UNMATCHED_ROUTE, "_OTHER"),
+    }
+
+
+def test_in_flight_returns_to_zero(client, recorded):
+    client.get("/api/tournaments/123456/standings")
+    with client.application.test_request_context("/wp-login.php"):
+        pass
+
+    [observation] = recorded.observe_in_flight(None)
+    assert observation.value == 0
+
+
+def test_latencies_are_bounded_without_collection(monkeypatch, recorded):
+    monkeypatch.setattr(metrics, "MAX_PENDING_LATENCIES", 3)
+    for _ in range(5):
+        recorded.started()
+        recorded.finished(None, "GET", 404, 1_000)
+        recorded.ended()
+
+    assert _collect(recorded) == {(metrics.UNMATCHED_ROUTE, "GET", 404): 5}
+    assert len(metrics.response_latency_histogram.points) == 3
+
+
+def test_metrics_are_not_recorded_without_exporter(app, recorded):
+    app.test_client().get("/wp-login.php")
+
+    assert _collect(recorded) == {}
+    assert "/metrics" not in {rule.rule for rule in app.url_map.iter_rules()}
+
+
+def test_prometheus_scrape(client, monkeypatch):
+    pytest.importorskip("opentelemetry.exporter.prometheus")
+    monkeypatch.setattr(metrics, "_telemetry_ready", False)
+    client.get("/wp-login.php")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    assert 'http_requests_total{http_request_method="GET"' in response.text
+
+
+def test_unknown_exporter_is_rejected():
+    class BadConfig(MetricsConfig):
+        TELEMETRY_EXPORTER = "statsd"
+
+    with pytest.raises(RuntimeError, match="TELEMETRY_EXPORTER"):
+        create_app(BadConfig)
+
+
+def test_active_users_are_live_stream_viewers():
+    subscription = broadcaster.subscribe(match_id=987654)
+    try:
+        [observation] = metrics._observe_active_users(None)
+        assert observation.value >= 1
+    finally:
+        broadcaster.unsubscribe(subscription)
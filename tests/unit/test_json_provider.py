@@ -0,0 +1,60 @@
+import datetime
+import json
+
+import pytest
+from flask import Flask
+
+from decorators import format_response
+from json_provider import init_json_provider
+
+orjson = pytest.importorskip("orjson")
+
+
+def _app(provider):
+    app = Flask(__name__)
+    app.config["JSON_PROVIDER"] = provider
+    init_json_provider(app)
+    return app
+
+
+def test_auto_uses_orjson_when_installed():
+    app = _app("auto")
+
+    assert type(app.json).__name__ == "OrjsonProvider"
+
+
+def test_orjson_output_matches_default_provider():
+    payload = {
+        "when": datetime.datetime(2024, 1, 2, 3, 4, 5),
+        "day": datetime.date(2024, 1, 2),
+        "pots": [(1, 2), (8, 3)],
+        "description": "Игрок забил шар",
+    }
+
+    fast = _app("orjson").json.dumps(payload)
+    default = _app("default").json.dumps(payload)
+
+    assert json.loads(fast) == json.loads(default)
+
+
+def test_format_response_serializes_envelope_once(monkeypatch):
+    app = _app("orjson")
+    calls = []
+    dumps = orjson.dumps
+
+    def counting_dumps(*args, **kwargs):
+        calls.append(args[0])
+        return dumps(*args, **kwargs)
+
+    monkeypatch.setattr(orjson, "dumps", counting_dumps)
+
+    @app.route("/status")
+    @format_response
+    def status():
+        return {"event": {"balls_pocketed": [1, 8]}}, 201
+
+    response = app.test_client().get("/status")
+
+    assert response.status_code == 201
+    assert response.get_json()["data"] == {"event": {"balls_pocketed": [1, 8]}}
+    assert len(calls) == 1
@@ -0,0 +1,57 @@
+from extensions import db
+from models import Event, MatchStateSnapshot
+
+
+def test_batch_events_are_stored_in_one_go(client, create_match):
+    match = create_match()
+    game_id, match_id = match.game_id, match.id
+
+    response = client.post(
+        f"/api/game/{game_id}/match/{match_id}/events:batch",
+        json={
+            "events": [
+                {"event_type": "BALL_POTTED", "data": {"ball_number": 3, "pocket_id": 2}},
+                {"event_type": "FOUL", "data": {"reason": "scratch"}},
+                {"event_type": "BALL_POTTED", "data": {"ball_number": 5, "pocket_id": 1}},
+            ]
+        },
+    )
+
+    json_data = response.get_json()
+    events = Event.query.filter_by(match_id=match_id).order_by(Event.id).all()
+    snapshot = db.session.get(MatchStateSnapshot, match_id)
+    assert response.status_code == 200
+    assert [result["event_id"] for result in json_data["data"]["results"]] == [
+        event.id for event in events
+    ]
+    assert json_data["data"]["event"] is not None
+    assert snapshot.last_event_id == events[-1].id
+
+
+def test_invalid_batch_stores_nothing(client, create_match):
+    match = create_match()
+    game_id, match_id = match.game_id, match.id
+
+    response = client.post(
+        f"/api/game/{game_id}/match/{match_id}/events:batch",
+        json=[
+            {"event_type": "BALL_POTTED", "data": {"ball_number": 3, "pocket_id": 2}},
+            {"event_type": "FOUL", "data": {}},
+        ],
+    )
+
+    assert response.status_code == 400
+    assert Event.query.filter_by(match_id=match_id).count() == 0
+    assert db.session.get(MatchStateSnapshot, match_id) is None
+
+
+def test_batch_requires_array_of_events(client, create_match):
+    match = create_match()
+    game_id, match_id = match.game_id, match.id
+
+    response = client.post(
+        f"/api/game/{game_id}/match/{match_id}/events:batch",
+        json={"event_type": "FOUL", "data": {"reason": "scratch"}},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,83 @@
+import pytest
+
+import metrics
+from controllers import match_controller
+from controllers.match_controller import MatchEventService
+from extensions import db
+
+
+class FakeHistogram:
+    def __init__(self):
+        self.points = []
+
+    def record(self, value, attributes=None):
+        self.points.append((value, attributes))
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    histograms = {
+        "phases": FakeHistogram(),
+        "replayed": FakeHistogram(),
+        "statements": FakeHistogram(),
+    }
+    monkeypatch.setattr(metrics, "match_event_phase_duration", histograms["phases"])
+    monkeypatch.setattr(match_controller, "match_events_replayed", histograms["replayed"])
+    monkeypatch.setattr(
+        match_controller, "match_event_db_statements", histograms["statements"]
+    )
+    return histograms
+
+
+def _pot(service, match, ball_number):
+    service.process_event(
+        game_type="8ball",
+        event_type="BALL_POTTED",
+        data={"ball_number": ball_number, "pocket_id": 1},
+        match_id=match.id,
+        write=True,
+    )
+
+
+def test_process_event_records_every_phase(create_match, recorded):
+    match = create_match()
+
+    _pot(MatchEventService(), match, 1)
+
+    phases = [attributes["phase"] for _, attributes in recorded["phases"].points]
+    assert phases == [
+        "schema_load",
+        "event_fetch",
+        "replay",
+        "flush",
+        "commit",
+        "apply",
+        "win_check",
+    ]
+    assert all(duration >= 0 for duration, _ in recorded["phases"].points)
+    assert recorded["replayed"].points == [(0, None)]
+
+
+def test_statements_are_counted_per_request(create_match, recorded):
+    match = create_match()
+    service = MatchEventService()
+
+    _pot(service, match, 1)
+    _pot(service, match, 2)
+
+    counts = [count for count, _ in recorded["statements"].points]
+    assert len(counts) == 2
+    assert all(count > 0 for count in counts)
+    assert recorded["statements"].points[0][1] == {"operation": "process_event"}
+
+
+def test_statement_count_only_sees_its_own_block(app):
+    with metrics.statement_count() as outer:
+        db.session.execute(db.text("SELECT 1"))
+        with metrics.statement_count() as inner:
+            db.session.execute(db.text("SELECT 1"))
+        db.session.execute(db.text("SELECT 1"))
+    db.session.execute(db.text("SELECT 1"))
+
+    assert inner == [1]
+    assert outer == [2]
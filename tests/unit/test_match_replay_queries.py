@@ -0,0 +1,63 @@
+from controllers.match_controller import MatchEventService
+from extensions import db
+from models import Event, EventType, Game, Match, Player
+from models.events import BallPottedEventData, FoulEventData, HitBallEventData
+
+
+def _create_match_with_events(count):
+    player1 = Player(name="Replay One")
+    player2 = Player(name="Replay Two")
+    db.session.add_all([player1, player2])
+    db.session.flush()
+    game = Game(player1_id=player1.id, player2_id=player2.id)
+    db.session.add(game)
+    db.session.flush()
+    match = Match(game_id=game.id, player1_id=player1.id, player2_id=player2.id)
+    db.session.add(match)
+    db.session.flush()
+
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            new_event = Event(
+                match_id=match.id, event_type=EventType.HIT_BALL, player_id=player1.id
+            )
+            new_event.hit_ball_data.append(HitBallEventData(ball_number=i % 15 + 1))
+        elif kind == 1:
+            new_event = Event(
+                match_id=match.id,
+                event_type=EventType.BALL_POTTED,
+                player_id=player1.id,
+            )
+            new_event.ball_potted_data.append(
+                BallPottedEventData(ball_number=i % 15 + 1, pocket_id=i % 6 + 1)
+            )
+        else:
+            new_event = Event(
+                match_id=match.id, event_type=EventType.FOUL, player_id=player2.id
+            )
+            new_event.foul_data.append(FoulEventData(reason="scratch"))
+        db.session.add(new_event)
+    db.session.commit()
+    match_id = match.id
+    db.session.expunge_all()
+    return match_id
+
+
+def _replay_query_count(count_queries, event_count):
+    match_id = _create_match_with_events(event_count)
+    service = MatchEventService()
+    with count_queries() as statements:
+        match_state = service._load_match_state("8ball", match_id)
+    return len(statements), match_state
+
+
+def test_replay_query_count_does_not_grow_with_events(count_queries):
+    small_count, _ = _replay_query_count(count_queries, 9)
+    large_count, match_state = _replay_query_count(count_queries, 90)
+
+    assert large_count == small_count
+    # snapshot lookup, events joined with their match, three detail tables
+    assert large_count <= 5
+    assert len(match_state["fouls"]) == 30
+    assert len(match_state["balls_pocketed"]) == 30
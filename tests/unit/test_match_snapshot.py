@@ -0,0 +1,77 @@
+from controllers.match_controller import MatchEventService
+from extensions import db
+from models import Event, MatchStateSnapshot
+
+
+def test_snapshot_written_with_event(create_match):
+    match = create_match()
+    service = MatchEventService()
+
+    service.process_event(
+        game_type="8ball",
+        event_type="BALL_POTTED",
+        data={"ball_number": 1, "pocket_id": 1},
+        match_id=match.id,
+        write=True,
+    )
+
+    snapshot = db.session.get(MatchStateSnapshot, match.id)
+    last_event = Event.query.filter_by(match_id=match.id).one()
+    assert snapshot is not None
+    assert snapshot.last_event_id == last_event.id
+    assert snapshot.version == 1
+
+
+def test_only_events_after_snapshot_are_replayed(create_match, monkeypatch):
+    match = create_match()
+    service = MatchEventService()
+    replayed = []
+    reconstruct = service._reconstruct_match_state
+
+    def spy(events, *args, **kwargs):
+        replayed.append(len(events))
+        return reconstruct(events, *args, **kwargs)
+
+    monkeypatch.setattr(service, "_reconstruct_match_state", spy)
+
+    for ball_number in (1, 2, 3):
+        service.process_event(
+            game_type="8ball",
+            event_type="BALL_POTTED",
+            data={"ball_number": ball_number, "pocket_id": 1},
+            match_id=match.id,
+            write=True,
+        )
+
+    snapshot = db.session.get(MatchStateSnapshot, match.id)
+    assert replayed == [0, 0, 0]
+    assert snapshot.version == 3
+    assert Event.query.filter_by(match_id=match.id).count() == 3
+
+
+def test_events_without_snapshot_are_replayed_once(create_match, monkeypatch):
+    match = create_match()
+    for _ in range(2):
+        db.session.add(Event(match_id=match.id, event_type="FOUL"))
+    db.session.commit()
+
+    service = MatchEventService()
+    replayed = []
+    reconstruct = service._reconstruct_match_state
+
+    def spy(events, *args, **kwargs):
+        replayed.append(len(events))
+        return reconstruct(events, *args, **kwargs)
+
+    monkeypatch.setattr(service, "_reconstruct_match_state", spy)
+
+    for _ in range(2):
+        service.process_event(
+            game_type="8ball",
+            event_type="FOUL",
+            data={"reason": "scratch"},
+            match_id=match.id,
+            write=True,
+        )
+
+    assert replayed == [2, 0]
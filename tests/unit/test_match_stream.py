@@ -0,0 +1,64 @@
+import json
+
+from controllers.broadcast import MatchBroadcaster, broadcaster
+
+
+def _parse(chunk):
+    lines = chunk.decode() if isinstance(chunk, bytes) else chunk
+    fields = dict(line.split(": ", 1) for line in lines.strip().splitlines())
+    return fields["event"], json.loads(fields["data"])
+
+
+def test_publish_fans_out_one_message():
+    hub = MatchBroadcaster()
+    first, second, other = hub.subscribe(1), hub.subscribe(1), hub.subscribe(2)
+
+    delivered = hub.publish(1, "message")
+
+    assert delivered == 2
+    assert first.get(timeout=0) is second.get(timeout=0) == "message"
+    assert other.get(timeout=0) is None
+
+
+def test_slow_subscriber_is_dropped():
+    hub = MatchBroadcaster(max_pending=1)
+    subscription = hub.subscribe(1)
+
+    hub.publish(1, "first")
+    hub.publish(1, "second")
+
+    assert subscription.closed
+    assert not hub.has_subscribers(1)
+
+
+def test_stream_sends_state_then_deltas(client, create_match):
+    match = create_match()
+    game_id, match_id = match.game_id, match.id
+    response = client.get(
+        f"/api/game/{game_id}/match/{match_id}/stream", buffered=False
+    )
+    chunks = iter(response.response)
+
+    event, data = _parse(next(chunks))
+    assert response.mimetype == "text/event-stream"
+    assert event == "state"
+    assert data["last_event_id"] is None
+    assert broadcaster.has_subscribers(match_id)
+
+    posted = client.post(
+        f"/api/game/{game_id}/match/{match_id}/event",
+        json={
+            "event_type": "FOUL",
+            "data": {"reason": "scratch"},
+            "write": "True",
+        },
+    )
+    assert posted.status_code == 200
+
+    event, data = _parse(next(chunks))
+    assert event == "update"
+    assert [item["event_type"] for item in data["events"]] == ["FOUL"]
+    assert isinstance(data["delta"], dict)
+
+    response.close()
+    assert not broadcaster.has_subscribers(match_id)
@@ -0,0 +1,55 @@
+from extensions import db
+from models.news import Tag
+from pagination import NEXT_CURSOR_HEADER
+
+
+def _collect_pages(client, url):
+    items, pages, after = [], 0, None
+    while True:
+        page_url = url if after is None else f"{url}&after={after}"
+        response = client.get(page_url)
+        assert response.status_code == 200
+        items.extend(response.get_json()["data"])
+        pages += 1
+        after = response.headers.get(NEXT_CURSOR_HEADER)
+        if after is None:
+            return items, pages
+
+
+def test_keyset_pages_cover_every_row_once(client):
+    names = [f"paged-{i}" for i in range(5)]
+    db.session.add_all(Tag(name=name) for name in names)
+    db.session.commit()
+    total = Tag.query.count()
+
+    items, pages = _collect_pages(client, "/api/tags?limit=2")
+
+    ids = [item["id"] for item in items]
+    assert ids == sorted(ids)
+    assert len(ids) == len(set(ids)) == total
+    assert pages == (total + 1) // 2
+    assert names == [item["name"] for item in items if item["name"] in names]
+
+
+def test_fields_projection(client):
+    db.session.add(Tag(name="projected"))
+    db.session.commit()
+
+    response = client.get("/api/tags?fields=name&limit=1000")
+
+    data = response.get_json()["data"]
+    assert response.status_code == 200
+    assert all(set(item) == {"name"} for item in data)
+    assert "projected" in [item["name"] for item in data]
+
+
+def test_unknown_field_rejected(client):
+    response = client.get("/api/seasons?fields=name,nope")
+
+    assert response.status_code == 400
+
+
+def test_limit_is_bounded(client):
+    response = client.get("/api/game/all?limit=100000")
+
+    assert response.status_code == 422
@@ -0,0 +1,124 @@
+from datetime import date
+
+from controllers.match_controller import MatchEventService
+from controllers.stats_controller import CLUB, SEASON, PlayerStatsService
+from extensions import db
+from models import Game, Match, Player, PlayerStats
+from models.club import Club
+from models.match import MatchStatus
+from models.season import Season
+
+
+def _create_league(player_count=4):
+    season = Season(name="Stats", start_date=date(2026, 1, 1), end_date=date(2026, 12, 31))
+    club = Club(name="Stats Club", address="Main st. 1")
+    players = [Player(name=f"Stats Player {i}") for i in range(player_count)]
+    db.session.add_all([season, club, *players])
+    db.session.commit()
+    return season, club, players
+
+
+def _finish_match(season, club, player1, player2):
+    game = Game(
+        player1_id=player1.id,
+        player2_id=player2.id,
+        season_id=season.id,
+        club_id=club.id,
+    )
+    db.session.add(game)
+    db.session.flush()
+    match = Match(game_id=game.id, player1_id=player1.id, player2_id=player2.id)
+    db.session.add(match)
+    db.session.commit()
+    MatchEventService()._finalize_match(match.id, {})
+    return match
+
+
+def _stats(scope_type, scope_id):
+    return {
+        stats.player_id: (stats.played, stats.wins, stats.losses)
+        for stats in PlayerStats.query.filter_by(scope_type=scope_type, scope_id=scope_id)
+    }
+
+
+def test_finalize_updates_match_profiles_and_stats(app):
+    season, club, (first, second, *_) = _create_league(2)
+
+    match = _finish_match(season, club, first, second)
+    _finish_match(season, club, first, second)
+
+    assert match.status == MatchStatus.COMPLETED
+    assert match.winner_id == first.id
+    assert first.wins == 2 and second.losses == 2
+    expected = {first.id: (2, 2, 0), second.id: (2, 0, 2)}
+    assert _stats(SEASON, season.id) == expected
+    assert _stats(CLUB, club.id) == expected
+
+
+def test_finalizing_twice_counts_the_match_once(app):
+    season, club, (first, second, *_) = _create_league(2)
+    match = _finish_match(season, club, first, second)
+    ratings = (first.score, second.score)
+
+    MatchEventService()._finalize_match(match.id, {})
+
+    assert first.wins == 1 and second.losses == 1
+    assert (first.score, second.score) == ratings
+    assert first.rated_matches == second.rated_matches == 1
+    expected = {first.id: (1, 1, 0), second.id: (1, 0, 1)}
+    assert _stats(SEASON, season.id) == expected
+    assert _stats(CLUB, club.id) == expected
+
+
+def test_leaderboard_orders_by_wins_with_keyset_cursor(app):
+    season, club, players = _create_league(4)
+    for winner, loser in [(0, 1), (0, 2), (0, 3), (2, 1), (2, 3), (1, 3)]:
+        _finish_match(season, club, players[winner], players[loser])
+    service = PlayerStatsService()
+
+    page, cursor = service.leaderboard(SEASON, season.id, limit=2)
+    rest, last_cursor = service.leaderboard(SEASON, season.id, limit=2, after=cursor)
+
+    assert [row.player_id for row in page + rest] == [
+        players[0].id,
+        players[2].id,
+        players[1].id,
+        players[3].id,
+    ]
+    assert cursor == (2, players[2].id)
+    assert last_cursor is None
+
+
+def test_leaderboard_endpoint_returns_next_cursor(client):
+    season, club, players = _create_league(3)
+    _finish_match(season, club, players[0], players[1])
+    _finish_match(season, club, players[1], players[2])
+
+    first = client.get(
+        f"/api/clubs/{club.id}/leaderboard?limit=2",
+        headers={"Origin": "https://example.com"},
+    )
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get(f"/api/clubs/{club.id}/leaderboard?limit=2&after={cursor}")
+
+    assert first.status_code == 200
+    assert first.headers["Access-Control-Expose-Headers"] == "X-Next-Cursor"
+    assert [row["player_id"] for row in first.get_json()["data"]] == [
+        players[0].id,
+        players[1].id,
+    ]
+    assert first.get_json()["data"][0]["player_name"] == players[0].name
+    assert [row["player_id"] for row in second.get_json()["data"]] == [players[2].id]
+    assert "X-Next-Cursor" not in second.headers
+    assert client.get(f"/api/seasons/{season.id}/leaderboard?after=x").status_code == 422
+
+
+def test_rebuild_matches_incremental_stats(app):
+    season, club, players = _create_league(3)
+    for winner, loser in [(0, 1), (1, 2), (2, 0), (0, 2)]:
+        _finish_match(season, club, players[winner], players[loser])
+    incremental = (_stats(SEASON, season.id), _stats(CLUB, club.id))
+
+    PlayerStatsService().rebuild()
+
+    assert (_stats(SEASON, season.id), _stats(CLUB, club.id)) == incremental
@@ -0,0 +1,52 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import sqlite
+
+from extensions import db
+from models import Event, Game, Match
+from models.events import BallPottedEventData, FoulEventData, HitBallEventData
+from models.game import GameStatus
+from models.match import MatchStatus
+
+
+def _query_plan(statement):
+    compiled = statement.compile(
+        dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    rows = db.session.execute(db.text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return " | ".join(row[-1] for row in rows)
+
+
+def test_event_log_uses_match_timestamp_index(app):
+    plan = _query_plan(
+        select(Event)
+        .where(Event.match_id == 1, Event.id > 10)
+        .order_by(Event.timestamp.asc(), Event.id.asc())
+    )
+
+    assert "USING INDEX ix_events_match_id_timestamp (match_id=?)" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_match_lookup_uses_game_status_index(app):
+    plan = _query_plan(
+        select(Match).where(
+            Match.game_id == 1, Match.status == MatchStatus.IN_PROGRESS
+        )
+    )
+
+    assert "ix_matches_game_id_status (game_id=? AND status=?)" in plan
+
+
+def test_season_games_use_season_status_index(app):
+    plan = _query_plan(
+        select(Game).where(Game.season_id == 1, Game.status == GameStatus.IN_PROGRESS)
+    )
+
+    assert "ix_games_season_id_status (season_id=? AND status=?)" in plan
+
+
+def test_event_payloads_use_event_id_index(app):
+    for model in (HitBallEventData, BallPottedEventData, FoulEventData):
+        plan = _query_plan(select(model).where(model.event_id.in_([1, 2, 3])))
+
+        assert f"ix_{model.__tablename__}_event_id (event_id=?)" in plan
@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+
+import query_profiler
+from app import create_app
+from config import TestConfig
+from query_profiler import QueryProfile
+
+
+class ProfilerConfig(TestConfig):
+    RUN_MIGRATIONS = False
+    DEBUG = True
+    QUERY_PROFILER = True
+    QUERY_PROFILER_SLOWEST = 2
+    SLOW_QUERY_MS = 0
+    QUERY_BUDGETS = {"tournament_api.TournamentStandings": 0}
+
+
+class FakeInstrument:
+    def __init__(self):
+        self.points = []
+
+    def add(self, value, attributes=None):
+        self.points.append((value, attributes))
+
+    record = add
+
+
+@pytest.fixture(scope="module")
+def profiled_app(app):
+    return create_app(ProfilerConfig)
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    instruments = {
+        name: FakeInstrument()
+        for name in (
+            "db_queries_per_request",
+            "db_query_time_per_request",
+            "db_query_budget_exceeded",
+        )
+    }
+    for name, instrument in instruments.items():
+        monkeypatch.setattr(query_profiler, name, instrument)
+    return instruments
+
+
+def test_profile_keeps_the_slowest_statements():
+    profile = QueryProfile(keep=2)
+    for duration_ns, statement in ((3, "c"), (9, "a"), (1, "d"), (5, "b")):
+        profile.add(statement, duration_ns * 1_000_000)
+
+    assert profile.count == 4
+    assert profile.total_ms == 18
+    assert profile.slowest() == [(9.0, "a"), (5.0, "b")]
+
+
+def test_debug_headers_and_metrics(profiled_app, recorded):
+    response = profiled_app.test_client().get("/api/tournaments/123456/standings")
+
+    assert response.status_code == 404
+    count = int(response.headers["X-Query-Count"])
+    assert count >= 1
+    assert float(response.headers["X-Query-Time-Ms"]) >= 0
+    slowest = response.headers.getlist("X-Query-Slowest")
+    assert 1 <= len(slowest) <= 2
+    assert "SELECT" in slowest[0]
+
+    route = {"http.route": "/api/tournaments/<int:tournament_id>/standings"}
+    assert recorded["db_queries_per_request"].points == [(count, route)]
+    assert recorded["db_query_time_per_request"].points[0][1] == route
+
+
+def test_budget_violations_are_logged(profiled_app, recorded, caplog):
+    client = profiled_app.test_client()
+    with caplog.at_level(logging.WARNING, logger="backend"):
+        client.get("/api/tournaments/123456/standings")
+        client.get("/wp-login.php")
+
+    budget_logs = [r for r in caplog.records if "Query budget exceeded" in r.message]
+    assert len(budget_logs) == 1
+    assert "tournament_api.TournamentStandings" in budget_logs[0].message
+    assert len(recorded["db_query_budget_exceeded"].points) == 1
+    assert any("Slow query" in r.message for r in caplog.records)
+
+
+def test_profiler_is_off_by_default(client):
+    response = client.get("/api/tournaments/123456/standings")
+
+    assert "X-Query-Count" not in response.headers
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from controllers.match_controller import MatchEventService
+from controllers.rating_controller import RatingService, expected_score
+from extensions import db
+from models import Game, Match, Player
+from models.match import MatchStatus
+
+
+def _league_matches(count=2_000, players=50, seed=7):
+    rng = random.Random(seed)
+    matches = []
+    for _ in range(count):
+        player1, player2 = rng.sample(range(1, players + 1), 2)
+        matches.append((player1, player2, rng.choice((player1, player2))))
+    return matches
+
+
+def test_expected_scores_are_complementary():
+    assert expected_score(1500, 1500) == 0.5
+    assert expected_score(1700, 1500) + expected_score(1500, 1700) == pytest.approx(1)
+    assert expected_score(1900, 1500) == pytest.approx(10 / 11)
+
+
+def test_replay_is_sequential_elo():
+    service = RatingService(k_factor=32, initial=1500)
+
+    ratings = service.compute([(1, 2, 1), (1, 3, 3)])
+
+    assert ratings[2] == (1484, 1)
+    assert ratings[3][0] == round(1500 + 32 * expected_score(1516, 1500))
+    assert ratings[1][1] == 2
+
+
+def _finish_match(player1, player2):
+    game = Game(player1_id=player1.id, player2_id=player2.id)
+    db.session.add(game)
+    db.session.flush()
+    match = Match(game_id=game.id, player1_id=player1.id, player2_id=player2.id)
+    db.session.add(match)
+    db.session.commit()
+    MatchEventService()._finalize_match(match.id, {})
+    return match
+
+
+def test_finalize_updates_elo_ratings(app):
+    winner, loser = Player(name="Elo Winner"), Player(name="Elo Loser")
+    db.session.add_all([winner, loser])
+    db.session.commit()
+
+    _finish_match(winner, loser)
+
+    k_factor, initial = app.config["RATING_K_FACTOR"], app.config["RATING_INITIAL"]
+    assert winner.score == initial + k_factor / 2
+    assert loser.score == initial - k_factor / 2
+    assert winner.rated_matches == loser.rated_matches == 1
+
+
+def test_rebuild_replays_history_with_new_parameters(app):
+    players = [Player(name=f"Rebuild Player {i}", played_games=4) for i in range(3)]
+    db.session.add_all(players)
+    db.session.commit()
+    for first, second in [(0, 1), (0, 2), (1, 2), (0, 1)]:
+        _finish_match(players[first], players[second])
+    incremental = [player.score for player in players]
+
+    RatingService().rebuild()
+    rebuilt = [player.score for player in players]
+    RatingService(k_factor=64).rebuild()
+
+    assert rebuilt == incremental
+    assert players[0].score > rebuilt[0] > rebuilt[1] > players[1].score
+    assert [player.rated_matches for player in players] == [3, 3, 2]
+    assert [player.played_games for player in players] == [4, 4, 4]
+    completed = Match.query.filter_by(status=MatchStatus.COMPLETED).count()
+    assert sum(player.rated_matches for player in Player.query) == 2 * completed
@@ -0,0 +1,107 @@
+import json
+import os
+
+import pytest
+from werkzeug.exceptions import HTTPException
+
+from controllers.match_controller import MatchEventService
+from controllers.rules import RulesCache, compile_validator, rules_cache
+
+
+def _write_rules(path, rules, mtime):
+    path.write_text(json.dumps(rules))
+    os.utime(path, (mtime, mtime))
+
+
+def test_rules_are_parsed_once_and_frozen(tmp_path):
+    path = tmp_path / "rules.json"
+    _write_rules(path, {"8ball": {"foul": {"validations": []}}}, 1_000_000)
+    cache = RulesCache(path=str(path), check_interval=0)
+
+    rules = cache.get()
+
+    assert cache.get() is rules
+    assert rules["8ball"]["foul"]["validations"] == ()
+    with pytest.raises(TypeError):
+        rules["8ball"] = {}
+
+
+def test_rules_reload_when_mtime_changes(tmp_path):
+    path = tmp_path / "rules.json"
+    _write_rules(path, {"8ball": {}}, 1_000_000)
+    cache = RulesCache(path=str(path), check_interval=0)
+    assert "american" not in cache.get()
+
+    _write_rules(path, {"8ball": {}, "american": {}}, 1_000_100)
+
+    assert "american" in cache.get()
+
+
+def test_rules_not_rechecked_within_interval(tmp_path):
+    path = tmp_path / "rules.json"
+    _write_rules(path, {"8ball": {}}, 1_000_000)
+    cache = RulesCache(path=str(path), check_interval=3600)
+    rules = cache.get()
+
+    _write_rules(path, {"american": {}}, 1_000_100)
+
+    assert cache.get() is rules
+
+
+def test_broken_reload_keeps_previous_rules(tmp_path):
+    path = tmp_path / "rules.json"
+    _write_rules(path, {"8ball": {}}, 1_000_000)
+    cache = RulesCache(path=str(path), check_interval=0)
+    rules = cache.get()
+
+    path.write_text("{not json")
+    os.utime(path, (1_000_100, 1_000_100))
+
+    assert cache.get() is rules
+
+
+def test_services_share_process_rules():
+    assert MatchEventService().rules is rules_cache.get()
+    assert MatchEventService().rules is MatchEventService().rules
+
+
+def test_compiled_validator_checks_required_and_range():
+    validator = compile_validator(
+        [
+            {"type": "required", "field": "ball_number"},
+            {"type": "range", "field": "ball_number", "min": 1, "max": 8},
+            {"type": "range", "field": "force", "min": 1, "max": 10},
+        ]
+    )
+
+    validator({"ball_number": 3, "force": 5})
+    with pytest.raises(HTTPException) as missing:
+        validator({"ball_number": 3})
+    with pytest.raises(HTTPException) as out_of_range:
+        validator({"ball_number": 9, "force": 5})
+
+    assert missing.value.code == 400
+    assert "'force' is required" in missing.value.data["message"]
+    assert "'ball_number' must be between 1 and 8" in out_of_range.value.data["message"]
+
+
+def test_unknown_rule_type_rejected_at_load(tmp_path):
+    path = tmp_path / "rules.json"
+    _write_rules(
+        path,
+        {"8ball": {"foul": {"validations": [{"type": "regex", "field": "reason"}]}}},
+        1_000_000,
+    )
+
+    with pytest.raises(ValueError):
+        RulesCache(path=str(path), check_interval=0).get()
+
+
+def test_validate_event_uses_compiled_rules():
+    service = MatchEventService()
+
+    service.validate_event(1, "8ball", "foul", {"reason": "scratch"})
+    with pytest.raises(HTTPException):
+        service.validate_event(1, "8ball", "foul", {})
+    with pytest.raises(ValueError):
+        service.validate_event(1, "pyramid", "foul", {"reason": "scratch"})
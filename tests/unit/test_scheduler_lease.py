@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta, timezone
+
+from extensions import db
+from models import SchedulerLease
+from scheduler import JobLease, check_season, start_scheduler
+
+
+def test_only_one_owner_holds_a_lease(app):
+    first = JobLease("test_job", ttl=60, owner="worker-1")
+    second = JobLease("test_job", ttl=60, owner="worker-2")
+
+    assert first.acquire()
+    assert not second.acquire()
+    assert first.acquire()  # the owner renews its own lease
+    assert db.session.get(SchedulerLease, "test_job").owner == "worker-1"
+
+
+def test_expired_lease_is_taken_over(app):
+    JobLease("expiring_job", ttl=60, owner="worker-1").acquire()
+    lease = db.session.get(SchedulerLease, "expiring_job")
+    lease.expires_at = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+        seconds=1
+    )
+    db.session.commit()
+
+    assert JobLease("expiring_job", ttl=60, owner="worker-2").acquire()
+
+
+def test_job_skipped_when_another_process_holds_the_lease(app, monkeypatch):
+    runs = []
+    monkeypatch.setattr("scheduler.rollover_season", lambda: runs.append(1))
+    JobLease("season_job", ttl=60, owner="other-process").acquire()
+
+    check_season(app, lease=JobLease("season_job", ttl=60, owner="this-process"))
+    check_season(app, lease=JobLease("season_job", ttl=60, owner="other-process"))
+
+    assert runs == [1]
+
+
+def test_scheduler_disabled_by_config(app):
+    assert app.config["SCHEDULER_ENABLED"] is False
+    assert start_scheduler(app) is None
@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+
+from extensions import db
+from schemas import TagSchema
+from schemas.events import FoulEventSchema
+from schemas.registry import get_schema
+
+
+def test_same_variant_is_built_once():
+    assert get_schema(TagSchema) is get_schema(TagSchema)
+    assert get_schema(TagSchema, many=True) is get_schema(TagSchema, many=True)
+    assert get_schema(TagSchema, only=["name"]) is get_schema(TagSchema, only=("name",))
+    assert get_schema(TagSchema, only=["name", "id"]) is get_schema(
+        TagSchema, only=("id", "name", "id")
+    )
+
+
+def test_variants_are_kept_apart():
+    plain = get_schema(TagSchema)
+    many = get_schema(TagSchema, many=True)
+    partial = get_schema(TagSchema, partial=True)
+    only = get_schema(TagSchema, many=True, only=["name"])
+
+    assert len({id(plain), id(many), id(partial), id(only)}) == 4
+    assert many.many and not plain.many
+    assert partial.partial is True
+    assert set(only.fields) == {"name"}
+
+
+def test_invalid_only_is_not_cached():
+    with pytest.raises(ValueError):
+        get_schema(TagSchema, only=["nope"])
+
+
+def test_shared_schema_loads_from_many_threads(app):
+    schema = get_schema(FoulEventSchema)
+    reasons = [f"reason {i}" for i in range(32)]
+    loaded = {}
+
+    def load(reason):
+        with app.app_context():
+            loaded[reason] = schema.load({"reason": reason}, session=db.session).reason
+
+    threads = [threading.Thread(target=load, args=(reason,)) for reason in reasons]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loaded == {reason: reason for reason in reasons}
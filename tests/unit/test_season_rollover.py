@@ -0,0 +1,66 @@
+from datetime import date
+
+from sqlalchemy import insert
+
+from extensions import db
+from models import Game, Season
+from models.game import GameStatus
+from scheduler import get_current_season_dates, rollover_season
+
+GAMES = 100_000
+
+
+def test_winter_season_spans_the_new_year():
+    assert get_current_season_dates(date(2028, 1, 10)) == (
+        "Winter 2027-2028",
+        date(2027, 12, 1),
+        date(2028, 2, 29),
+    )
+    assert get_current_season_dates(date(2030, 12, 5))[2] == date(2031, 2, 28)
+
+
+def test_rollover_moves_unfinished_games_in_one_statement(count_queries):
+    Season.query.update({Season.is_active: False})
+    old_season = Season(
+        name="Autumn 2030",
+        start_date=date(2030, 9, 1),
+        end_date=date(2030, 11, 30),
+        is_active=True,
+    )
+    db.session.add(old_season)
+    db.session.commit()
+    db.session.execute(
+        insert(Game.__table__),
+        [
+            {
+                "season_id": old_season.id,
+                "status": (
+                    GameStatus.COMPLETED if i % 2 else GameStatus.IN_PROGRESS
+                ).name,
+            }
+            for i in range(GAMES)
+        ],
+    )
+    db.session.commit()
+
+    try:
+        with count_queries() as statements:
+            new_season, moved = rollover_season(today=date(2030, 12, 1))
+        updates = [s for s in statements if s.startswith("UPDATE games")]
+        again, moved_again = rollover_season(today=date(2030, 12, 2))
+
+        assert moved == GAMES // 2
+        assert len(updates) == 1
+        assert new_season.name == "Winter 2030-2031" and new_season.is_active
+        assert not old_season.is_active
+        assert Game.query.filter_by(season_id=new_season.id).count() == GAMES // 2
+        assert (again.id, moved_again) == (new_season.id, 0)
+        assert Season.query.filter_by(name="Winter 2030-2031").count() == 1
+    finally:
+        db.session.rollback()
+        seasons = Season.query.filter(Season.start_date >= old_season.start_date)
+        Game.query.filter(Game.season_id.in_([season.id for season in seasons])).delete(
+            synchronize_session=False
+        )
+        seasons.update({Season.is_active: False})
+        db.session.commit()
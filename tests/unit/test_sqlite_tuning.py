@@ -0,0 +1,69 @@
+import threading
+
+from sqlalchemy import create_engine, text
+
+from extensions import apply_sqlite_pragmas, db
+
+
+def test_app_engine_uses_configured_pragmas(app):
+    with db.engine.connect() as connection:
+        journal_mode = connection.execute(text("PRAGMA journal_mode")).scalar()
+        synchronous = connection.execute(text("PRAGMA synchronous")).scalar()
+        busy_timeout = connection.execute(text("PRAGMA busy_timeout")).scalar()
+        temp_store = connection.execute(text("PRAGMA temp_store")).scalar()
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+    assert busy_timeout == app.config["SQLITE_BUSY_TIMEOUT"]
+    assert temp_store == 2  # MEMORY
+
+
+def test_parallel_writers_and_readers(app, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'concurrency.db'}")
+    apply_sqlite_pragmas(engine, app.config)
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE shots (id INTEGER PRIMARY KEY, writer INTEGER)")
+        )
+
+    writers, readers, shots_per_writer = 4, 4, 50
+    errors = []
+    done = threading.Event()
+
+    def write(writer):
+        try:
+            for _ in range(shots_per_writer):
+                with engine.begin() as connection:
+                    connection.execute(
+                        text("INSERT INTO shots (writer) VALUES (:writer)"),
+                        {"writer": writer},
+                    )
+        except Exception as e:
+            errors.append(e)
+
+    def read():
+        try:
+            while not done.is_set():
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT count(*) FROM shots")).scalar()
+        except Exception as e:
+            errors.append(e)
+
+    reader_threads = [threading.Thread(target=read) for _ in range(readers)]
+    writer_threads = [
+        threading.Thread(target=write, args=(writer,)) for writer in range(writers)
+    ]
+    for thread in reader_threads + writer_threads:
+        thread.start()
+    for thread in writer_threads:
+        thread.join()
+    done.set()
+    for thread in reader_threads:
+        thread.join()
+
+    with engine.connect() as connection:
+        total = connection.execute(text("SELECT count(*) FROM shots")).scalar()
+    engine.dispose()
+
+    assert errors == []
+    assert total == writers * shots_per_writer
@@ -0,0 +1,63 @@
+import flask_migrate
+import pytest
+
+import metrics
+from app import create_app
+from config import TestConfig
+from startup import StartupProfile, import_times, profile_startup
+
+
+class NoMigrationsConfig(TestConfig):
+    RUN_MIGRATIONS = False
+
+
+class OtlpConfig(NoMigrationsConfig):
+    TELEMETRY_EXPORTER = "otlp"
+
+
+def _fail_upgrade(*args, **kwargs):
+    raise AssertionError("migrations must not run")
+
+
+def test_create_app_skips_migrations_when_disabled(monkeypatch):
+    monkeypatch.setattr(flask_migrate, "upgrade", _fail_upgrade)
+    profile = StartupProfile()
+
+    create_app(NoMigrationsConfig, profile=profile)
+
+    steps = [name for name, _ in profile.steps]
+    assert steps[0] == "config"
+    assert "migrations" in steps and "blueprints" in steps
+    assert profile.total == pytest.approx(sum(seconds for _, seconds in profile.steps))
+
+
+def test_telemetry_is_deferred_to_first_request(monkeypatch):
+    monkeypatch.setattr(metrics, "_telemetry_ready", False)
+    calls = []
+    monkeypatch.setattr(metrics, "init_telemetry", calls.append)
+
+    app = create_app(OtlpConfig)
+    assert calls == []
+
+    app.test_client().get("/no-such-route")
+    assert calls == [app.config]
+
+
+def test_import_times_groups_by_package():
+    total, packages = import_times("json")
+
+    assert total > 0
+    assert "json" in dict(packages)
+    assert [seconds for _, seconds in packages] == sorted(
+        (seconds for _, seconds in packages), reverse=True
+    )
+
+
+def test_profile_startup_report(monkeypatch):
+    monkeypatch.setattr(flask_migrate, "upgrade", _fail_upgrade)
+
+    report = profile_startup(create_app, NoMigrationsConfig, top=3)
+
+    assert report.startswith("Imports (fresh interpreter):")
+    assert "create_app(NoMigrationsConfig)" in report
+    assert "ms target)" in report.splitlines()[-1]
@@ -0,0 +1,78 @@
+import random
+
+from controllers.swiss import SwissStandings, pair_score_group, swiss_pairings
+from controllers.tournament_controller import TournamentService
+from models import Game
+from models.game import GameStatus
+from models.tounament import TournamentType
+
+
+def _pair(standings, ratings):
+    return swiss_pairings(
+        standings.ranked(ratings), standings.points, standings.opponents, standings.byes
+    )
+
+
+def test_score_group_pairs_top_half_against_bottom_half():
+    pairs, floaters = pair_score_group([1, 2, 3, 4], {1: {3}, 2: set(), 3: {1}, 4: set()})
+
+    assert pairs == [(1, 4), (2, 3)]
+    assert floaters == []
+
+
+def test_first_round_pairs_by_rating_with_bye_for_lowest():
+    ratings = {1: 1900, 2: 1800, 3: 1700, 4: 1600, 5: 1500}
+    standings = SwissStandings(ratings, [])
+
+    pairs, bye = _pair(standings, ratings)
+
+    assert pairs == [(1, 3), (2, 4)]
+    assert bye == 5
+
+
+def test_rounds_avoid_rematches_and_repeated_byes():
+    rng = random.Random(3)
+    ratings = {player: rng.randint(1000, 2000) for player in range(1, 42)}
+    games = []
+    for round_number in range(1, 8):
+        standings = SwissStandings(ratings, games)
+        pairs, bye = _pair(standings, ratings)
+
+        assert bye not in standings.byes
+        assert sorted([p for pair in pairs for p in pair] + [bye]) == sorted(ratings)
+        for player1, player2 in pairs:
+            assert player2 not in standings.opponents[player1]
+            assert abs(standings.points[player1] - standings.points[player2]) <= 1
+        games.extend(
+            (round_number, player1, player2, rng.choice((player1, player2)))
+            for player1, player2 in pairs
+        )
+        games.append((round_number, bye, None, bye))
+
+
+def test_service_pairs_swiss_rounds_after_results(client, create_tournament):
+    tournament, players = create_tournament(TournamentType.SWISS, 5)
+    service = TournamentService()
+
+    first = service.generate_schedule(tournament.id)
+    early = client.post(f"/api/tournaments/{tournament.id}/rounds")
+    for game in Game.query.filter_by(
+        tournament_id=tournament.id, status=GameStatus.IN_PROGRESS
+    ):
+        service.record_result(tournament.id, game.id, game.player1_id)
+    second = client.post(f"/api/tournaments/{tournament.id}/rounds")
+
+    assert first == {"tournament_id": tournament.id, "rounds": 1, "games": 3}
+    assert early.status_code == 409
+    assert second.status_code == 201
+    assert second.get_json()["data"]["rounds"] == 2
+    round_one, round_two = (
+        {
+            frozenset((game.player1_id, game.player2_id))
+            for game in Game.query.filter_by(
+                tournament_id=tournament.id, round_number=number
+            )
+        }
+        for number in (1, 2)
+    )
+    assert not round_one & round_two
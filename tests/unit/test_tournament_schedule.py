@@ -0,0 +1,100 @@
+from itertools import combinations
+
+import pytest
+
+from controllers.tournament_controller import (
+    TournamentService,
+    elimination_rounds,
+    round_robin_rounds,
+    seeding_order,
+)
+from models import Game
+from models.game import GameStatus
+from models.tounament import TournamentPhase, TournamentType
+
+
+@pytest.mark.parametrize("player_count", [2, 5, 8, 11])
+def test_round_robin_pairs_everyone_once(player_count):
+    rounds = round_robin_rounds(range(player_count))
+
+    pairs = [frozenset(game[:2]) for games in rounds for game in games]
+    assert len(rounds) == player_count - (player_count + 1) % 2
+    assert sorted(map(sorted, pairs)) == sorted(
+        map(sorted, combinations(range(player_count), 2))
+    )
+    for games in rounds:
+        players = [player for game in games for player in game[:2]]
+        assert len(players) == len(set(players))
+
+
+def test_seeding_keeps_top_seeds_apart():
+    assert seeding_order(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+    order = seeding_order(16)
+    assert order.index(1) < 8 <= order.index(2)
+
+
+def test_elimination_gives_byes_to_top_seeds():
+    rounds = elimination_rounds([10, 20, 30, 40, 50, 60])
+
+    assert [len(games) for games in rounds] == [4, 2, 1]
+    assert rounds[0] == [(10, None, 10), (40, 50, None), (20, None, 20), (30, 60, None)]
+    assert rounds[1] == [(10, None, None), (20, None, None)]
+
+
+def test_round_robin_schedule_is_inserted(create_tournament):
+    tournament, players = create_tournament(TournamentType.ROUND_ROBIN, 7)
+
+    summary = TournamentService().generate_schedule(tournament.id)
+
+    games = Game.query.filter_by(tournament_id=tournament.id).all()
+    assert summary == {"tournament_id": tournament.id, "rounds": 7, "games": 21}
+    assert len(games) == 21
+    assert {game.round_number for game in games} == set(range(1, 8))
+    assert tournament.phase == TournamentPhase.GROUP_STAGE
+    assert tournament.player_count == 7
+
+
+def test_elimination_winners_advance_to_final(create_tournament):
+    tournament, players = create_tournament(TournamentType.ELIMINATION, 3)
+    service = TournamentService()
+    service.generate_schedule(tournament.id)
+    top, second, third = players[2], players[1], players[0]
+
+    semi_final, bye = (
+        Game.query.filter_by(tournament_id=tournament.id, round_number=1)
+        .order_by(Game.id)
+        .all()
+    )[::-1]
+    final = Game.query.filter_by(tournament_id=tournament.id, round_number=2).one()
+    assert (bye.bracket_position, semi_final.bracket_position) == (0, 1)
+    assert final.bracket_position == 0
+    assert (bye.player1_id, bye.player2_id, bye.winner_id) == (top.id, None, top.id)
+    assert (semi_final.player1_id, semi_final.player2_id) == (second.id, third.id)
+    assert final.player1_id == top.id and final.player2_id is None
+
+    service.record_result(tournament.id, semi_final.id, third.id)
+    assert final.player2_id == third.id
+    service.record_result(tournament.id, final.id, third.id)
+
+    assert final.status == GameStatus.COMPLETED
+    assert tournament.phase == TournamentPhase.COMPLETED
+
+
+def test_schedule_endpoints(client, create_tournament):
+    tournament, players = create_tournament(TournamentType.ELIMINATION, 4)
+
+    created = client.post(f"/api/tournaments/{tournament.id}/schedule")
+    again = client.post(f"/api/tournaments/{tournament.id}/schedule")
+    schedule = client.get(f"/api/tournaments/{tournament.id}/schedule")
+    first_game = schedule.get_json()["data"][0]
+    invalid = client.post(
+        f"/api/tournaments/{tournament.id}/games/{first_game['id']}/result",
+        json={"winner_id": -1},
+    )
+
+    assert created.status_code == 201
+    assert created.get_json()["data"]["games"] == 3
+    assert again.status_code == 409
+    assert len(schedule.get_json()["data"]) == 3
+    assert invalid.status_code == 400
+    assert client.post("/api/tournaments/0/schedule").status_code == 404
@@ -0,0 +1,97 @@
+import random
+
+from sqlalchemy import or_
+
+from controllers.standings_controller import StandingsService
+from controllers.tournament_controller import TournamentService
+from extensions import db
+from models import Game, TournamentStanding
+from models.game import GameStatus
+from models.tounament import TournamentType
+
+COLUMNS = ("played", "wins", "losses", "byes", "points", "buchholz", "sonneborn_berger")
+
+
+def _cached(tournament_id):
+    db.session.expire_all()
+    return {
+        row.player_id: tuple(getattr(row, column) for column in COLUMNS)
+        for row in TournamentStanding.query.filter_by(tournament_id=tournament_id)
+    }
+
+
+def _game_between(tournament_id, player1, player2):
+    return Game.query.filter(
+        Game.tournament_id == tournament_id,
+        or_(
+            (Game.player1_id == player1.id) & (Game.player2_id == player2.id),
+            (Game.player1_id == player2.id) & (Game.player2_id == player1.id),
+        ),
+    ).one()
+
+
+def test_incremental_swiss_standings_match_recompute(create_tournament):
+    rng = random.Random(11)
+    tournament, players = create_tournament(TournamentType.SWISS, 9)
+    service = TournamentService()
+
+    service.generate_schedule(tournament.id)
+    for _ in range(4):
+        for game in Game.query.filter_by(
+            tournament_id=tournament.id, status=GameStatus.IN_PROGRESS
+        ).all():
+            winner = rng.choice((game.player1_id, game.player2_id))
+            service.record_result(tournament.id, game.id, winner)
+            incremental = _cached(tournament.id)
+            StandingsService().recompute(tournament.id)
+            assert _cached(tournament.id) == incremental
+        service.pair_next_round(tournament.id)
+
+    standings = _cached(tournament.id)
+    assert len(standings) == 9
+    assert sum(row[COLUMNS.index("byes")] for row in standings.values()) == 5
+
+
+def test_incremental_elimination_standings_match_recompute(create_tournament):
+    tournament, players = create_tournament(TournamentType.ELIMINATION, 6)
+    service = TournamentService()
+    service.generate_schedule(tournament.id)
+
+    while True:
+        game = (
+            Game.query.filter(
+                Game.tournament_id == tournament.id,
+                Game.status == GameStatus.IN_PROGRESS,
+                Game.player1_id.isnot(None),
+                Game.player2_id.isnot(None),
+            )
+            .order_by(Game.id)
+            .first()
+        )
+        if game is None:
+            break
+        service.record_result(tournament.id, game.id, game.player2_id)
+
+    incremental = _cached(tournament.id)
+    StandingsService().recompute(tournament.id)
+    assert _cached(tournament.id) == incremental
+
+
+def test_standings_endpoint_breaks_ties_head_to_head(client, create_tournament):
+    tournament, (a, b, c, d) = create_tournament(TournamentType.ROUND_ROBIN, 4)
+    service = TournamentService()
+    service.generate_schedule(tournament.id)
+    for loser, winner in [(a, b), (c, a), (a, d), (b, c)]:
+        game = _game_between(tournament.id, loser, winner)
+        service.record_result(tournament.id, game.id, winner.id)
+
+    response = client.get(f"/api/tournaments/{tournament.id}/standings")
+
+    rows = response.get_json()["data"]
+    assert response.status_code == 200
+    # b and c tie on points, Buchholz and Sonneborn-Berger, but c beat b
+    assert [row["player_id"] for row in rows] == [a.id, c.id, b.id, d.id]
+    assert [row["rank"] for row in rows] == [1, 2, 3, 4]
+    assert rows[1]["head_to_head"] == 1 and rows[2]["head_to_head"] == 0
+    assert rows[0]["buchholz"] == 3 and rows[0]["player_name"] == a.name
+    assert client.get("/api/tournaments/0/standings").status_code == 404